@@ -4,8 +4,25 @@ import os
 import sys
 import subprocess
 import json
+import shlex
 import shutil
+import functools
 import importlib.util
+from importlib.metadata import version, PackageNotFoundError
+
+# Optional faster JSON parsers for the tool list
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Errors raised by whichever parser is in use
+JSON_ERRORS = (ValueError,) + ((ijson.JSONError,) if ijson else ())
 
 # ANSI color codes
 GREEN = '\033[92m'
@@ -27,47 +44,47 @@ def print_status(message, status="info"):
     else:
         print(f"  {message}")
 
-def check_module_importable(module_name):
-    """Check if a module can be imported."""
-    spec = importlib.util.find_spec(module_name)
-    return spec is not None
+@functools.cache
+def find_module_spec(module_name):
+    """Locate a module's import spec without importing it."""
+    return importlib.util.find_spec(module_name)
 
-def run_command(cmd, quiet=False):
-    """Run a command and return its output and return code."""
+def import_from_spec(spec):
+    """Import a module from an already located spec, skipping a second path search."""
+    if spec.name in sys.modules:
+        return sys.modules[spec.name]
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
     try:
-        result = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=False
-        )
-        if not quiet:
-            print_status(f"Command: {' '.join(cmd)}")
-            if result.stdout and not quiet:
-                print_status(f"Output: {result.stdout.strip()}")
-            if result.stderr and not quiet:
-                print_status(f"Error: {result.stderr.strip()}", "warning")
-        
-        return result.stdout, result.stderr, result.returncode
-    except Exception as e:
-        if not quiet:
-            print_status(f"Failed to run command: {e}", "error")
-        return "", str(e), 1
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[spec.name]
+        raise
+    return module
+
+def iter_json_items(stream):
+    """Yield the items of a top-level JSON array, parsing incrementally when ijson is available."""
+    if ijson is not None:
+        yield from ijson.items(stream, "item")
+    elif orjson is not None:
+        yield from orjson.loads(stream.read())
+    else:
+        yield from json.loads(stream.read())
 
 def check_mcp_version():
     """Check the installed MCP version."""
     print_status("Checking MCP installation", "header")
     
     # Check if mcp module can be imported
-    if check_module_importable("mcp"):
+    spec = find_module_spec("mcp")
+    if spec is not None:
         print_status("MCP module is importable", "success")
         
-        # Check version by importing
+        # Check version by loading the module from the spec found above
         try:
-            import mcp
-            version = getattr(mcp, "__version__", "unknown")
-            print_status(f"MCP version (from module): {version}", "success")
+            mcp = import_from_spec(spec)
+            module_version = getattr(mcp, "__version__", "unknown")
+            print_status(f"MCP version (from module): {module_version}", "success")
         except ImportError as e:
             print_status(f"Error importing mcp: {e}", "error")
     else:
@@ -77,16 +94,14 @@ def check_mcp_version():
     mcp_path = shutil.which("mcp")
     if mcp_path:
         print_status(f"MCP CLI found at: {mcp_path}", "success")
-        
-        # Check version using CLI
-        stdout, stderr, ret_code = run_command(["mcp", "--version"], quiet=True)
-        if ret_code == 0:
-            print_status(f"MCP CLI version: {stdout.strip()}", "success")
-        else:
-            print_status("Failed to get MCP CLI version", "error")
-            print_status(stderr)
     else:
         print_status("MCP CLI not found in PATH", "error")
+    
+    # Check the installed package version without spawning the CLI
+    try:
+        print_status(f"MCP package version: {version('mcp')}", "success")
+    except PackageNotFoundError:
+        print_status("Failed to get MCP package version", "error")
 
 def test_mcp_client():
     """Test MCP client functionality with the server."""
@@ -102,43 +117,55 @@ def test_mcp_client():
     
     # Test getting tool list
     print_status("Testing tool list retrieval:")
-    stdout, stderr, ret_code = run_command(["mcp", "client", "--tool-list", mcp_server_path])
+    cmd = ["mcp", "client", "--tool-list", mcp_server_path]
+    print_status(f"Command: {shlex.join(cmd)}")
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+    except Exception as e:
+        print_status(f"Failed to run command: {e}", "error")
+        print_status("Failed to retrieve tools", "error")
+        return
     
-    if ret_code == 0:
+    # Show tool names as they are parsed instead of loading the whole list first
+    tool_count = 0
+    with proc:
         try:
-            tools = json.loads(stdout)
-            print_status(f"Successfully retrieved {len(tools)} tools", "success")
-            
-            # Show tool names
-            if tools:
-                print_status("Available tools:")
-                for tool in tools:
-                    print_status(f"  - {tool.get('name', 'unnamed')}")
-        except json.JSONDecodeError:
-            print_status("Failed to parse tools JSON", "error")
+            for tool in iter_json_items(proc.stdout):
+                if tool_count == 0:
+                    print_status("Available tools:")
+                print_status(f"  - {tool.get('name', 'unnamed')}")
+                tool_count += 1
+        except JSON_ERRORS:
+            # Drain the rest of the output so the child can't block on a full pipe
+            proc.communicate()
+            if proc.returncode == 0:
+                print_status("Failed to parse tools JSON", "error")
+                return
+    
+    if proc.returncode == 0:
+        print_status(f"Successfully retrieved {tool_count} tools", "success")
     else:
         print_status("Failed to retrieve tools", "error")
 
+# Static recommendations text, in the same layout print_status would produce
+RECOMMENDATIONS = f"""
+{BOLD}Recommendations{RESET}
+  If you're experiencing issues with MCP:
+  1. Reinstall the MCP package:
+     pip uninstall -y mcp
+     pip install --upgrade mcp>=1.4.0
+  2. Ensure the MCP server is running:
+     python ../Jira_mcp/mcp_server.py
+  3. Try running the MCP client directly:
+     mcp client --tool-list ../Jira_mcp/mcp_server.py
+  4. Check if the MCP CLI tools are in your PATH:
+     which mcp
+  5. If MCP is installed in a virtual environment, make sure it's activated
+"""
+
 def recommend_fixes():
     """Provide recommendations to fix common issues."""
-    print_status("Recommendations", "header")
-    
-    print_status("If you're experiencing issues with MCP:")
-    
-    print_status("1. Reinstall the MCP package:")
-    print_status("   pip uninstall -y mcp")
-    print_status("   pip install --upgrade mcp>=1.4.0")
-    
-    print_status("2. Ensure the MCP server is running:")
-    print_status("   python ../Jira_mcp/mcp_server.py")
-    
-    print_status("3. Try running the MCP client directly:")
-    print_status("   mcp client --tool-list ../Jira_mcp/mcp_server.py")
-    
-    print_status("4. Check if the MCP CLI tools are in your PATH:")
-    print_status("   which mcp")
-    
-    print_status("5. If MCP is installed in a virtual environment, make sure it's activated")
+    sys.stdout.write(RECOMMENDATIONS)
 
 if __name__ == "__main__":
     print_status(f"MCP Diagnostic Tool", "header")
@@ -4,14 +4,16 @@ import os
 import sys
 import asyncio
 import argparse
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
+from contextlib import AsyncExitStack, asynccontextmanager
 from dotenv import load_dotenv
-import json
 
 # Load environment variables
 load_dotenv()
 
+# Jira settings required by the create/search/get commands, checked once after .env is loaded
+REQUIRED_ENV_VARS = ("JIRA_URL", "JIRA_EMAIL", "JIRA_API_TOKEN")
+MISSING_ENV_VARS = tuple(var for var in REQUIRED_ENV_VARS if not os.environ.get(var))
+
 # Path to MCP server script
 MCP_SERVER_PATH = os.path.join("..", "Jira_mcp", "mcp_server.py")
 
@@ -22,35 +24,55 @@ if not os.path.exists(MCP_SERVER_PATH):
         print(f"Error: MCP server script not found at {MCP_SERVER_PATH}")
         sys.exit(1)
 
-async def list_tools():
+@asynccontextmanager
+async def _session(server_path=MCP_SERVER_PATH):
+    """Open one MCP session that is shared by every command for the CLI's lifetime"""
+    # Imported here so help and argument errors don't pay for loading mcp
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+    
+    server_params = StdioServerParameters(
+        command="python",
+        args=[server_path],
+        env=None
+    )
+    
+    async with AsyncExitStack() as stack:
+        read, write = await stack.enter_async_context(stdio_client(server_params))
+        session = await stack.enter_async_context(ClientSession(read, write))
+        await session.initialize()
+        yield session
+
+def _extract_text(result):
+    """Return the text of the first content item of a tool result, or None"""
+    try:
+        return result.content[0].text
+    except (AttributeError, IndexError, TypeError):
+        return None
+
+async def list_tools(session):
     """List all available Jira tools"""
     try:
-        server_params = StdioServerParameters(
-            command="python",
-            args=[MCP_SERVER_PATH],
-            env=None
-        )
+        tools_result = await session.list_tools()
         
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                tools_result = await session.list_tools()
-                
-                if hasattr(tools_result, 'tools'):
-                    tools = tools_result.tools
-                    print(f"Found {len(tools)} tools:")
-                    for tool in tools:
-                        print(f"  - {tool.name}: {tool.description}")
-                        print(f"    Required parameters: {', '.join(tool.inputSchema.get('required', []))}")
-                else:
-                    print("No tools found or unexpected result format")
+        if hasattr(tools_result, 'tools'):
+            tools = tools_result.tools
+            lines = [f"Found {len(tools)} tools:"]
+            lines.extend(
+                f"  - {tool.name}: {tool.description}\n"
+                f"    Required parameters: {', '.join(tool.inputSchema.get('required', []))}"
+                for tool in tools
+            )
+            print("\n".join(lines))
+        else:
+            print("No tools found or unexpected result format")
         
         return True
     except Exception as e:
         print(f"Error listing tools: {str(e)}")
         return False
 
-async def create_ticket(project_key, summary, description, issue_type="Task"):
+async def create_ticket(session, project_key, summary, description, issue_type="Task"):
     """Create a new Jira ticket"""
     if not project_key:
         print("Error: Project key is required")
@@ -73,32 +95,21 @@ async def create_ticket(project_key, summary, description, issue_type="Task"):
     }
     
     try:
-        server_params = StdioServerParameters(
-            command="python",
-            args=[MCP_SERVER_PATH],
-            env=None
-        )
+        print(f"Creating ticket in project {project_key}...")
+        result = await session.call_tool("create_jira_ticket", arguments=params)
         
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                
-                print(f"Creating ticket in project {project_key}...")
-                result = await session.call_tool("create_jira_ticket", arguments=params)
-                
-                if hasattr(result, 'content') and result.content:
-                    content_item = result.content[0]
-                    if hasattr(content_item, 'text'):
-                        print(content_item.text)
-                        return content_item.text
-                
-                print(f"Ticket creation response: {result}")
-                return str(result)
+        text = _extract_text(result)
+        if text is not None:
+            print(text)
+            return text
+        
+        print(f"Ticket creation response: {result}")
+        return str(result)
     except Exception as e:
         print(f"Error creating ticket: {str(e)}")
         return f"Error: {str(e)}"
 
-async def search_tickets(query, project_key=None, max_results=10):
+async def search_tickets(session, query, project_key=None, max_results=10):
     """Search for Jira tickets using JQL"""
     # Prepare the search query
     if project_key and "project" not in query.lower():
@@ -107,36 +118,26 @@ async def search_tickets(query, project_key=None, max_results=10):
         search_query = query
     
     params = {
-        "query": search_query
+        "query": search_query,
+        "max_results": max_results
     }
     
     try:
-        server_params = StdioServerParameters(
-            command="python",
-            args=[MCP_SERVER_PATH],
-            env=None
-        )
+        print(f"Searching for tickets with query: {search_query}...")
+        result = await session.call_tool("search_jira_tickets", arguments=params)
         
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                
-                print(f"Searching for tickets with query: {search_query}...")
-                result = await session.call_tool("search_jira_tickets", arguments=params)
-                
-                if hasattr(result, 'content') and result.content:
-                    content_item = result.content[0]
-                    if hasattr(content_item, 'text'):
-                        print(content_item.text)
-                        return content_item.text
-                
-                print(f"Search response: {result}")
-                return str(result)
+        text = _extract_text(result)
+        if text is not None:
+            print(text)
+            return text
+        
+        print(f"Search response: {result}")
+        return str(result)
     except Exception as e:
         print(f"Error searching tickets: {str(e)}")
         return f"Error: {str(e)}"
 
-async def get_ticket(ticket_id):
+async def get_ticket(session, ticket_id):
     """Get details of a Jira ticket"""
     if not ticket_id:
         print("Error: Ticket ID is required")
@@ -147,60 +148,64 @@ async def get_ticket(ticket_id):
     }
     
     try:
-        server_params = StdioServerParameters(
-            command="python",
-            args=[MCP_SERVER_PATH],
-            env=None
-        )
+        print(f"Getting details for ticket {ticket_id}...")
+        result = await session.call_tool("get_jira_ticket", arguments=params)
+        
+        text = _extract_text(result)
+        if text is not None:
+            print(text)
+            return text
         
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                
-                print(f"Getting details for ticket {ticket_id}...")
-                result = await session.call_tool("get_jira_ticket", arguments=params)
-                
-                if hasattr(result, 'content') and result.content:
-                    content_item = result.content[0]
-                    if hasattr(content_item, 'text'):
-                        print(content_item.text)
-                        return content_item.text
-                
-                print(f"Ticket details response: {result}")
-                return str(result)
+        print(f"Ticket details response: {result}")
+        return str(result)
     except Exception as e:
         print(f"Error getting ticket details: {str(e)}")
         return f"Error: {str(e)}"
 
-async def check_server_status():
+async def check_server_status(session):
     """Check MCP server status"""
     try:
-        server_params = StdioServerParameters(
-            command="python",
-            args=[MCP_SERVER_PATH],
-            env=None
-        )
-        
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                try:
-                    await session.initialize()
-                    print("MCP server is responding correctly!")
-                    return True
-                except Exception as e:
-                    print(f"MCP server connection error: {str(e)}")
-                    return False
+        await session.send_ping()
+        print("MCP server is responding correctly!")
+        return True
     except Exception as e:
-        print(f"Error checking server status: {str(e)}")
+        print(f"MCP server connection error: {str(e)}")
         return False
 
+async def list_tools_all(server_paths):
+    """List the tools of several MCP servers concurrently"""
+    async with AsyncExitStack() as stack:
+        sessions = []
+        for path in server_paths:
+            try:
+                sessions.append(await stack.enter_async_context(_session(path)))
+            except Exception as e:
+                print(f"{path}: connection error: {str(e)}")
+                sessions.append(None)
+        
+        results = await asyncio.gather(
+            *(session.list_tools() for session in sessions if session is not None),
+            return_exceptions=True
+        )
+    
+    results = iter(results)
+    all_ok = True
+    for path, session in zip(server_paths, sessions):
+        if session is None:
+            all_ok = False
+            continue
+        result = next(results)
+        if isinstance(result, Exception):
+            print(f"{path}: error listing tools: {str(result)}")
+            all_ok = False
+        else:
+            print(f"{path}: {len(result.tools)} tools ({', '.join(tool.name for tool in result.tools)})")
+    return all_ok
+
 def validate_jira_credentials():
     """Validate Jira credentials"""
-    required_vars = ["JIRA_URL", "JIRA_EMAIL", "JIRA_API_TOKEN"]
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
-    
-    if missing_vars:
-        print(f"Error: Missing required environment variables: {', '.join(missing_vars)}")
+    if MISSING_ENV_VARS:
+        print(f"Error: Missing required environment variables: {', '.join(MISSING_ENV_VARS)}")
         print("Please set these variables in your .env file or environment.")
         return False
     
@@ -232,6 +237,8 @@ async def main():
     
     # Status check command
     status_parser = subparsers.add_parser("status", help="Check MCP server status")
+    status_parser.add_argument("--all", "-a", nargs="*", metavar="SERVER",
+                               help="List tools of each given MCP server script concurrently (default: the configured server)")
     
     # Parse arguments
     args = parser.parse_args()
@@ -241,19 +248,29 @@ async def main():
         if not validate_jira_credentials():
             return
     
-    # Execute the requested command
-    if args.command == "list":
-        await list_tools()
-    elif args.command == "create":
-        await create_ticket(args.project, args.title, args.description, args.type)
-    elif args.command == "search":
-        await search_tickets(args.query, args.project, args.max)
-    elif args.command == "get":
-        await get_ticket(args.id)
-    elif args.command == "status":
-        await check_server_status()
-    else:
+    if not args.command:
         parser.print_help()
+        return
+    
+    if args.command == "status" and args.all is not None:
+        await list_tools_all(args.all or [MCP_SERVER_PATH])
+        return
+    
+    # Connect once and run the requested command against the shared session
+    try:
+        async with _session() as session:
+            if args.command == "list":
+                await list_tools(session)
+            elif args.command == "create":
+                await create_ticket(session, args.project, args.title, args.description, args.type)
+            elif args.command == "search":
+                await search_tickets(session, args.query, args.project, args.max)
+            elif args.command == "get":
+                await get_ticket(session, args.id)
+            elif args.command == "status":
+                await check_server_status(session)
+    except Exception as e:
+        print(f"Error connecting to MCP server: {str(e)}")
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
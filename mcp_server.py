@@ -1,8 +1,14 @@
 from fastmcp import FastMCP
-import requests
+import httpx
 import os
+import orjson
+import asyncio
+import re
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
 # Load env vars
 load_dotenv()
@@ -14,8 +20,145 @@ JIRA_API_TOKEN = os.getenv("JIRA_API_TOKEN")
 AUTH = (JIRA_EMAIL, JIRA_API_TOKEN)
 HEADERS = {"Content-Type": "application/json"}
 
+# Shared HTTP client so every Jira call reuses pooled keep-alive connections
+_client = httpx.AsyncClient(
+    auth=AUTH,
+    headers=HEADERS,
+    http2=True,
+    timeout=30,
+    limits=httpx.Limits(max_keepalive_connections=20),
+)
+
+@asynccontextmanager
+async def lifespan(server):
+    """Close the shared HTTP client when the MCP server shuts down"""
+    try:
+        yield {}
+    finally:
+        await _client.aclose()
+
 # Initialize MCP server
-mcp = FastMCP("JiraMCP")
+mcp = FastMCP("JiraMCP", lifespan=lifespan)
+
+# Static schema for every tool exposed by this server, built once at import
+TOOLS_SCHEMA: Dict[str, Any] = {
+    "tools": [
+        {
+            "name": "create_jira_ticket",
+            "description": "Create a new Jira ticket",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "project_key": {"type": "string", "description": "Project key for the ticket"},
+                    "summary": {"type": "string", "description": "Summary/title of the ticket"},
+                    "description": {"type": "string", "description": "Detailed description of the ticket"},
+                    "issue_type": {"type": "string", "description": "Type of issue (Task, Bug, etc.)"},
+                    "assignee": {"type": "string", "description": "Username or display name of the assignee"}
+                },
+                "required": ["project_key", "summary", "description"]
+            }
+        },
+        {
+            "name": "update_jira_ticket",
+            "description": "Update an existing Jira ticket",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "issue_key": {"type": "string", "description": "The key of the ticket to update"},
+                    "summary": {"type": "string", "description": "New summary/title for the ticket"},
+                    "description": {"type": "string", "description": "New description for the ticket"},
+                    "status": {"type": "string", "description": "New status for the ticket"}
+                },
+                "required": ["issue_key"]
+            }
+        },
+        {
+            "name": "delete_jira_ticket",
+            "description": "Delete a Jira ticket",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "issue_key": {"type": "string", "description": "The key of the ticket to delete"}
+                },
+                "required": ["issue_key"]
+            }
+        },
+        {
+            "name": "get_jira_ticket",
+            "description": "Get details of a Jira ticket",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "issue_key": {"type": "string", "description": "The key of the ticket to retrieve"}
+                },
+                "required": ["issue_key"]
+            }
+        },
+        {
+            "name": "get_jira_tickets",
+            "description": "Get details of several Jira tickets in one call",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "issue_keys": {"type": "array", "description": "Keys of the tickets to retrieve (at most 100)"},
+                    "fields": {"type": "string", "description": "Comma-separated Jira fields to fetch (default summary,status)"}
+                },
+                "required": ["issue_keys"]
+            }
+        },
+        {
+            "name": "add_comment_to_ticket",
+            "description": "Add a comment to a Jira ticket",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "issue_key": {"type": "string", "description": "The key of the ticket"},
+                    "comment": {"type": "string", "description": "Comment text to add"}
+                },
+                "required": ["issue_key", "comment"]
+            }
+        },
+        {
+            "name": "assign_jira_ticket",
+            "description": "Assign a Jira ticket to a user",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "issue_key": {"type": "string", "description": "The key of the ticket"},
+                    "assignee": {"type": "string", "description": "Email or account ID of the assignee"}
+                },
+                "required": ["issue_key", "assignee"]
+            }
+        },
+        {
+            "name": "search_jira_tickets",
+            "description": "Search for Jira tickets using JQL",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "JQL query string"},
+                    "max_results": {"type": "integer", "description": "Maximum number of tickets to return (default 10)"},
+                    "start_at": {"type": "integer", "description": "Index of the first result, for paging (default 0)"},
+                    "fields": {"type": "string", "description": "Comma-separated Jira fields to fetch (default summary,status)"}
+                },
+                "required": ["query"]
+            }
+        },
+        {
+            "name": "batch_execute",
+            "description": "Run multiple Jira tools concurrently in one call",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "operations": {"type": "array", "description": "List of {\"tool\": name, \"arguments\": {...}} operations"},
+                    "max_concurrent": {"type": "integer", "description": "Maximum number of operations to run at once"},
+                    "stop_on_error": {"type": "boolean", "description": "Cancel remaining operations after the first failure"}
+                },
+                "required": ["operations"]
+            }
+        }
+    ]
+}
 
 def list_tools() -> Dict[str, Any]:
     """List all available Jira MCP tools.
@@ -24,109 +167,88 @@ def list_tools() -> Dict[str, Any]:
     including their parameters and expected return values.
     
     Returns:
-        Dict containing list of available tools with their schemas
+        Dict containing list of available tools with their schemas. This is
+        the shared TOOLS_SCHEMA object, so callers must not modify it.
     """
-    return {
-        "tools": [
-            {
-                "name": "create_jira_ticket",
-                "description": "Create a new Jira ticket",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_key": {"type": "string", "description": "Project key for the ticket"},
-                        "summary": {"type": "string", "description": "Summary/title of the ticket"},
-                        "description": {"type": "string", "description": "Detailed description of the ticket"},
-                        "issue_type": {"type": "string", "description": "Type of issue (Task, Bug, etc.)"},
-                        "assignee": {"type": "string", "description": "Username or display name of the assignee"}
-                    },
-                    "required": ["project_key", "summary", "description"]
-                }
-            },
-            {
-                "name": "update_jira_ticket",
-                "description": "Update an existing Jira ticket",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "issue_key": {"type": "string", "description": "The key of the ticket to update"},
-                        "summary": {"type": "string", "description": "New summary/title for the ticket"},
-                        "description": {"type": "string", "description": "New description for the ticket"},
-                        "status": {"type": "string", "description": "New status for the ticket"}
-                    },
-                    "required": ["issue_key"]
-                }
-            },
-            {
-                "name": "delete_jira_ticket",
-                "description": "Delete a Jira ticket",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "issue_key": {"type": "string", "description": "The key of the ticket to delete"}
-                    },
-                    "required": ["issue_key"]
-                }
-            },
-            {
-                "name": "get_jira_ticket",
-                "description": "Get details of a Jira ticket",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "issue_key": {"type": "string", "description": "The key of the ticket to retrieve"}
-                    },
-                    "required": ["issue_key"]
-                }
-            },
-            {
-                "name": "add_comment_to_ticket",
-                "description": "Add a comment to a Jira ticket",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "issue_key": {"type": "string", "description": "The key of the ticket"},
-                        "comment": {"type": "string", "description": "Comment text to add"}
-                    },
-                    "required": ["issue_key", "comment"]
-                }
-            },
-            {
-                "name": "assign_jira_ticket",
-                "description": "Assign a Jira ticket to a user",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "issue_key": {"type": "string", "description": "The key of the ticket"},
-                        "assignee": {"type": "string", "description": "Email or account ID of the assignee"}
-                    },
-                    "required": ["issue_key", "assignee"]
-                }
-            },
-            {
-                "name": "search_jira_tickets",
-                "description": "Search for Jira tickets using JQL",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "query": {"type": "string", "description": "JQL query string"}
-                    },
-                    "required": ["query"]
-                }
-            }
-        ]
-    }
+    return TOOLS_SCHEMA
+
+def _split_fields(fields: str) -> List[str]:
+    """Split a comma-separated Jira field list, ignoring blanks around and between names."""
+    return [name for name in (part.strip() for part in fields.split(",")) if name]
+
+def _adf(text: str) -> Dict[str, Any]:
+    """Wrap plain text in a single-paragraph Atlassian Document Format document."""
+    return {"type": "doc", "version": 1, "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}]}
+
+# Recently resolved assignee -> accountId mappings
+ACCOUNT_ID_CACHE_SIZE = 512
+_account_ids: "OrderedDict[str, str]" = OrderedDict()
+# Lookups in flight, so concurrent misses for the same assignee share one request
+_account_id_lookups: "Dict[str, asyncio.Future[Optional[str]]]" = {}
+
+async def _search_account_id(assignee: str) -> Optional[str]:
+    """Ask Jira for the account ID of a user and cache it on success."""
+    search_url = f"{JIRA_URL}/rest/api/3/user/search"
+    user_response = await _client.get(search_url, params={"query": assignee})
+    users = orjson.loads(user_response.content) if user_response.status_code == 200 else None
+    if not users:
+        print(f"Error finding user {assignee}: {user_response.text}")
+        return None
+    
+    # Use the first matching user's account ID
+    account_id = users[0].get('accountId')
+    if not account_id:
+        print(f"No account ID found for user: {assignee}")
+        return None
+    
+    _account_ids[assignee] = account_id
+    if len(_account_ids) > ACCOUNT_ID_CACHE_SIZE:
+        _account_ids.popitem(last=False)
+    return account_id
+
+async def _resolve_account_id(assignee: str) -> Optional[str]:
+    """Look up the Jira account ID for a user, caching successful lookups."""
+    # The cache and in-flight map are only touched between awaits on the
+    # server's event loop, so lookups for different users run concurrently
+    if assignee in _account_ids:
+        _account_ids.move_to_end(assignee)
+        return _account_ids[assignee]
+    
+    lookup = _account_id_lookups.get(assignee)
+    if lookup is None:
+        lookup = asyncio.ensure_future(_search_account_id(assignee))
+        _account_id_lookups[assignee] = lookup
+        lookup.add_done_callback(lambda _: _account_id_lookups.pop(assignee, None))
+    # Shield the shared lookup so one cancelled caller doesn't cancel the others
+    return await asyncio.shield(lookup)
+
+# Workflow transitions by project, issue type and current status, reused for
+# bulk status updates. Jira only offers the transitions out of an issue's
+# current status in its workflow, so the status has to be part of the key.
+TRANSITIONS_TTL = 60
+_transitions: Dict[Tuple[str, str, str], Tuple[float, List[Dict[str, Any]]]] = {}
+
+async def _get_transitions(issue_key: str, issue_type: str, current_status: str, refresh: bool = False) -> Tuple[List[Dict[str, Any]], bool]:
+    """Return the transitions available to a ticket and whether they were just fetched rather than cached."""
+    cache_key = (issue_key.split("-")[0], issue_type, current_status)
+    cached = _transitions.get(cache_key)
+    if not refresh and cached and time.monotonic() - cached[0] < TRANSITIONS_TTL:
+        return cached[1], False
+    
+    response = await _client.get(f"{JIRA_URL}/rest/api/3/issue/{issue_key}/transitions")
+    transitions = orjson.loads(response.content)["transitions"]
+    _transitions[cache_key] = (time.monotonic(), transitions)
+    return transitions, True
 
 # Tool to create a Jira ticket
-@mcp.tool()
-def create_jira_ticket(project_key: str, summary: str, description: str, issue_type: str = "Task", assignee: str = None) -> str:
+async def create_jira_ticket(project_key: str, summary: str, description: str, issue_type: str = "Task", assignee: str = None) -> str:
     """Create a new Jira ticket. Returns ticket key or error."""
     url = f"{JIRA_URL}/rest/api/3/issue"
     payload = {
         "fields": {
             "project": {"key": project_key},
             "summary": summary,
-            "description": {"type": "doc", "version": 1, "content": [{"type": "paragraph", "content": [{"type": "text", "text": description}]}]},
+            "description": _adf(description),
             "issuetype": {"name": issue_type}
         }
     }
@@ -134,95 +256,223 @@ def create_jira_ticket(project_key: str, summary: str, description: str, issue_t
     # Add assignee if provided
     if assignee:
         print(f"Adding assignee to ticket: {assignee}")
-        # For Jira Cloud, first we need to get the account ID for the user
-        search_url = f"{JIRA_URL}/rest/api/3/user/search?query={assignee}"
-        user_response = requests.get(search_url, auth=AUTH, headers=HEADERS)
-        
-        if user_response.status_code == 200 and user_response.json():
-            # Use the first matching user's account ID
-            account_id = user_response.json()[0].get('accountId')
-            if account_id:
-                payload["fields"]["assignee"] = {"accountId": account_id}
-                print(f"Found account ID for {assignee}: {account_id}")
-            else:
-                print(f"No account ID found for user: {assignee}")
-        else:
-            print(f"Error finding user {assignee}: {user_response.text}")
-    
-    response = requests.post(url, json=payload, auth=AUTH, headers=HEADERS)
-    return f"Ticket created: {response.json()['key']}" if response.status_code == 201 else f"Error: {response.text}"
+        # For Jira Cloud, the assignee must be given as an account ID
+        account_id = await _resolve_account_id(assignee)
+        if account_id:
+            payload["fields"]["assignee"] = {"accountId": account_id}
+            print(f"Found account ID for {assignee}: {account_id}")
+    
+    response = await _client.post(url, content=orjson.dumps(payload))
+    return f"Ticket created: {orjson.loads(response.content)['key']}" if response.status_code == 201 else f"Error: {response.text}"
 
 # Tool to update a Jira ticket
-@mcp.tool()
-def update_jira_ticket(issue_key: str, summary: str = None, description: str = None, status: str = None) -> str:
+async def update_jira_ticket(issue_key: str, summary: str = None, description: str = None, status: str = None) -> str:
     """Update an existing Jira ticket. Provide issue_key and fields to update. Returns success or error."""
     url = f"{JIRA_URL}/rest/api/3/issue/{issue_key}"
+    if not (summary or description or status):
+        return "Error: No fields to update"
+    
     payload = {"fields": {}}
     if summary:
         payload["fields"]["summary"] = summary
     if description:
-        payload["fields"]["description"] = {"type": "doc", "version": 1, "content": [{"type": "paragraph", "content": [{"type": "text", "text": description}]}]}
-    if status:
-        transitions = requests.get(f"{url}/transitions", auth=AUTH, headers=HEADERS).json()["transitions"]
-        transition_id = next((t["id"] for t in transitions if t["name"].lower() == status.lower()), None)
-        if transition_id:
-            response = requests.post(f"{url}/transitions", json={"transition": {"id": transition_id}}, auth=AUTH, headers=HEADERS)
-            return "Status updated" if response.status_code == 204 else f"Error: {response.text}"
+        payload["fields"]["description"] = _adf(description)
+    
+    if not status:
+        response = await _client.put(url, content=orjson.dumps(payload))
+        return "Ticket updated" if response.status_code == 204 else f"Error: {response.text}"
+    
+    # A status change needs the current status to pick the transition, so the
+    # same read also lets no-op updates skip the write calls
+    response = await _client.get(url, params={"fields": "summary,description,status,issuetype"})
+    if response.status_code != 200:
+        return f"Error: {response.text}"
+    current = orjson.loads(response.content)["fields"]
+    for name in ("summary", "description"):
+        if name in payload["fields"] and payload["fields"][name] == current.get(name):
+            del payload["fields"][name]
+    
+    issue_type, current_status = current["issuetype"]["name"], current["status"]["name"]
+    transition = None
+    for refresh in (False, True):
+        transitions, fetched = await _get_transitions(issue_key, issue_type, current_status, refresh=refresh)
+        transition = next((t for t in transitions if t["name"].lower() == status.lower()), None)
+        if transition or fetched:
+            break
+    
+    # Transitions are matched by name, so compare the status they lead to
+    if transition:
+        change_status = transition["to"]["name"].lower() != current_status.lower()
+    elif status.lower() == current_status.lower():
+        change_status = False
+    else:
         return "Error: Invalid status"
-    if not payload["fields"]:
-        return "Error: No fields to update"
-    response = requests.put(url, json=payload, auth=AUTH, headers=HEADERS)
-    return "Ticket updated" if response.status_code == 204 else f"Error: {response.text}"
+    
+    if not payload["fields"] and not change_status:
+        return "No changes to update"
+    
+    if payload["fields"]:
+        response = await _client.put(url, content=orjson.dumps(payload))
+        if response.status_code != 204:
+            return f"Error: {response.text}"
+        if not change_status:
+            return "Ticket updated"
+    
+    transitions_url = f"{url}/transitions"
+    response = await _client.post(transitions_url, content=orjson.dumps({"transition": {"id": transition["id"]}}))
+    if response.status_code in (400, 404) and not fetched:
+        # Cached transitions may be stale for this ticket, refetch once
+        transitions, fetched = await _get_transitions(issue_key, issue_type, current_status, refresh=True)
+        transition = next((t for t in transitions if t["name"].lower() == status.lower()), None)
+        if transition:
+            response = await _client.post(transitions_url, content=orjson.dumps({"transition": {"id": transition["id"]}}))
+    if response.status_code != 204:
+        error = response.text if transition else "Invalid status"
+        # Say so when the field update already went through
+        return f"Error: Ticket updated but status change failed: {error}" if payload["fields"] else f"Error: {error}"
+    return "Ticket and status updated" if payload["fields"] else "Status updated"
 
 # Tool to delete a Jira ticket
-@mcp.tool()
-def delete_jira_ticket(issue_key: str) -> str:
+async def delete_jira_ticket(issue_key: str) -> str:
     """Delete a Jira ticket by issue_key. Returns success or error."""
     url = f"{JIRA_URL}/rest/api/3/issue/{issue_key}"
-    response = requests.delete(url, auth=AUTH, headers=HEADERS)
+    response = await _client.delete(url)
     return "Ticket deleted" if response.status_code == 204 else f"Error: {response.text}"
 
 # Tool to get ticket details
-@mcp.tool()
-def get_jira_ticket(issue_key: str) -> str:
+async def get_jira_ticket(issue_key: str) -> str:
     """Retrieve details of a Jira ticket by issue_key. Returns ticket info or error."""
     url = f"{JIRA_URL}/rest/api/3/issue/{issue_key}"
-    response = requests.get(url, auth=AUTH, headers=HEADERS)
+    response = await _client.get(url)
     if response.status_code == 200:
-        data = response.json()
+        data = orjson.loads(response.content)
         return f"Ticket {issue_key}: {data['fields']['summary']} - {data['fields']['status']['name']}"
     return f"Error: {response.text}"
 
 # Tool to add a comment to a ticket
-@mcp.tool()
-def add_comment_to_ticket(issue_key: str, comment: str) -> str:
+async def add_comment_to_ticket(issue_key: str, comment: str) -> str:
     """Add a comment to a Jira ticket. Returns success or error."""
     url = f"{JIRA_URL}/rest/api/3/issue/{issue_key}/comment"
-    payload = {"body": {"type": "doc", "version": 1, "content": [{"type": "paragraph", "content": [{"type": "text", "text": comment}]}]}}
-    response = requests.post(url, json=payload, auth=AUTH, headers=HEADERS)
+    payload = {"body": _adf(comment)}
+    response = await _client.post(url, content=orjson.dumps(payload))
     return "Comment added" if response.status_code == 201 else f"Error: {response.text}"
 
 # Tool to assign a ticket
-@mcp.tool()
-def assign_jira_ticket(issue_key: str, assignee: str) -> str:
+async def assign_jira_ticket(issue_key: str, assignee: str) -> str:
     """Assign a Jira ticket to a user by email or account ID. Returns success or error."""
     url = f"{JIRA_URL}/rest/api/3/issue/{issue_key}/assignee"
     payload = {"accountId": assignee}
-    response = requests.put(url, json=payload, auth=AUTH, headers=HEADERS)
+    response = await _client.put(url, content=orjson.dumps(payload))
     return "Ticket assigned" if response.status_code == 204 else f"Error: {response.text}"
 
 # Tool to search tickets
-@mcp.tool()
-def search_jira_tickets(query: str) -> str:
-    """Search Jira tickets using JQL. Returns list of ticket keys or error."""
+async def search_jira_tickets(query: str, max_results: int = 10, start_at: int = 0, fields: str = "summary,status") -> str:
+    """Search Jira tickets using JQL. Use start_at/max_results to page and fields to limit returned fields. Returns list of ticket keys or error."""
     url = f"{JIRA_URL}/rest/api/3/search"
-    payload = {"jql": query, "maxResults": 10}
-    response = requests.post(url, json=payload, auth=AUTH, headers=HEADERS)
+    payload = {"jql": query, "maxResults": max_results, "startAt": start_at, "fields": _split_fields(fields)}
+    response = await _client.post(url, content=orjson.dumps(payload))
     if response.status_code == 200:
-        issues = [issue["key"] for issue in response.json()["issues"]]
+        issues = [issue["key"] for issue in orjson.loads(response.content)["issues"]]
         return f"Found tickets: {', '.join(issues)}" if issues else "No tickets found"
     return f"Error: {response.text}"
 
+# Limits for get_jira_tickets: total keys per call and keys per JQL search
+MAX_BULK_KEYS = 100
+BULK_CHUNK_SIZE = 50
+ISSUE_KEY_RE = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$", re.IGNORECASE)
+
+# Tool to get several tickets in one call
+async def get_jira_tickets(issue_keys: List[str], fields: str = "summary,status") -> str:
+    """Retrieve several Jira tickets by key with one search per 50 keys. Returns JSON list of tickets or error."""
+    if not issue_keys:
+        return "Error: No issue keys provided"
+    if len(issue_keys) > MAX_BULK_KEYS:
+        return f"Error: At most {MAX_BULK_KEYS} issue keys can be fetched at once"
+    invalid = [key for key in issue_keys if not ISSUE_KEY_RE.match(key)]
+    if invalid:
+        return f"Error: Invalid issue keys: {', '.join(invalid)}"
+    
+    url = f"{JIRA_URL}/rest/api/3/search"
+    field_list = _split_fields(fields)
+    chunks = [issue_keys[i:i + BULK_CHUNK_SIZE] for i in range(0, len(issue_keys), BULK_CHUNK_SIZE)]
+    # validateQuery=warn makes Jira skip unknown or deleted keys instead of
+    # rejecting the whole chunk with a 400
+    responses = await asyncio.gather(*(
+        _client.post(url, content=orjson.dumps({
+            "jql": f"key in ({','.join(chunk)})",
+            "maxResults": len(chunk),
+            "fields": field_list,
+            "validateQuery": "warn",
+        }))
+        for chunk in chunks
+    ))
+    
+    tickets = []
+    for response in responses:
+        if response.status_code != 200:
+            return f"Error: {response.text}"
+        for issue in orjson.loads(response.content)["issues"]:
+            # Keep only the name of object fields such as status or issuetype
+            ticket = {"key": issue["key"]}
+            for name, value in issue.get("fields", {}).items():
+                ticket[name] = value.get("name", value) if isinstance(value, dict) else value
+            tickets.append(ticket)
+    return orjson.dumps(tickets).decode()
+
+# Tools that can be dispatched from batch_execute
+BATCH_TOOLS = {
+    "create_jira_ticket": create_jira_ticket,
+    "update_jira_ticket": update_jira_ticket,
+    "delete_jira_ticket": delete_jira_ticket,
+    "get_jira_ticket": get_jira_ticket,
+    "get_jira_tickets": get_jira_tickets,
+    "add_comment_to_ticket": add_comment_to_ticket,
+    "assign_jira_ticket": assign_jira_ticket,
+    "search_jira_tickets": search_jira_tickets,
+}
+
+# Register the Jira tools with MCP. They are registered here rather than with
+# @mcp.tool() because FastMCP wraps decorated functions in FunctionTool objects,
+# which batch_execute cannot await directly.
+for _tool in BATCH_TOOLS.values():
+    mcp.tool()(_tool)
+
+# Tool to run several Jira operations in one call
+@mcp.tool()
+async def batch_execute(operations: List[Dict[str, Any]], max_concurrent: int = 5, stop_on_error: bool = False) -> str:
+    """Run multiple Jira tools concurrently. Each operation is {"tool": name, "arguments": {...}}. Returns JSON list of results."""
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+    async def run_operation(index: int, operation: Dict[str, Any]) -> Dict[str, Any]:
+        tool_name = operation.get("tool")
+        tool = BATCH_TOOLS.get(tool_name)
+        if tool is None:
+            return {"index": index, "tool": tool_name, "ok": False, "result": f"Error: Unknown tool {tool_name}"}
+        async with semaphore:
+            try:
+                result = await tool(**operation.get("arguments", {}))
+            except Exception as e:
+                return {"index": index, "tool": tool_name, "ok": False, "result": f"Error: {str(e)}"}
+        return {"index": index, "tool": tool_name, "ok": not result.startswith("Error"), "result": result}
+
+    tasks = [asyncio.create_task(run_operation(i, op)) for i, op in enumerate(operations)]
+    for next_done in asyncio.as_completed(tasks):
+        outcome = await next_done
+        if stop_on_error and not outcome["ok"]:
+            for task in tasks:
+                task.cancel()
+            break
+
+    # Let the cancellations land. Operations that finished before them keep
+    # their real result, and only the ones that were stopped report Cancelled.
+    await asyncio.gather(*tasks, return_exceptions=True)
+    results = [
+        {"index": i, "tool": op.get("tool"), "ok": False, "result": "Error: Cancelled"} if task.cancelled() else task.result()
+        for i, (task, op) in enumerate(zip(tasks, operations))
+    ]
+
+    return orjson.dumps(results).decode()
+
 @mcp.prompt()
 def echo_prompt(message: str) -> str:
     """Create an echo prompt"""
@@ -1,5 +1,7 @@
 import os
 import streamlit as st
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import asyncio
 import json
 import subprocess
@@ -8,19 +10,258 @@ import time
 import psutil
 import sys
 import re
-import traceback
+import logging
+import atexit
+import threading
+import concurrent.futures
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Optional
+import mcp
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+# Optional faster event loop for the MCP connection
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # Load environment variables
 load_dotenv()
 
+# Errors are logged with their tracebacks; formatting only happens for emitted records
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
 # Jira credentials from environment variables
 JIRA_URL = os.getenv("JIRA_URL")
 JIRA_EMAIL = os.getenv("JIRA_EMAIL")
 JIRA_API_TOKEN = os.getenv("JIRA_API_TOKEN")
 
+# Show debug output and developer controls, read once after .env is loaded
+DEBUG_MODE = os.getenv("DEBUG_MODE", "false").lower() == "true"
+
 # Path to MCP server
 MCP_SERVER_PATH = os.getenv("MCP_SERVER_PATH", os.path.join("..", "Jira_mcp", "mcp_server.py"))
 
+# Stylesheet injected at the top of every page render
+CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "app.css")
+
+# Seconds to reuse the MCP server process check between Streamlit reruns
+SERVER_STATUS_TTL = 2.0
+
+# Seconds to reuse ticket details and search results, and how many to keep
+TOOL_CACHE_TTL = 60
+TOOL_CACHE_SIZE = 256
+
+# Number of tickets from a search result whose details are fetched ahead of time
+# with one bulk call; set PREFETCH_TICKET_DETAILS=0 to turn prefetching off
+DEFAULT_PREFETCH_TICKET_DETAILS = 5
+try:
+    PREFETCH_TICKET_DETAILS = max(0, int(os.getenv("PREFETCH_TICKET_DETAILS", DEFAULT_PREFETCH_TICKET_DETAILS)))
+except ValueError:
+    logger.warning("Invalid PREFETCH_TICKET_DETAILS, using %d", DEFAULT_PREFETCH_TICKET_DETAILS)
+    PREFETCH_TICKET_DETAILS = DEFAULT_PREFETCH_TICKET_DETAILS
+
+# Number of tickets created in this session remembered for follow-up requests
+CREATED_TICKET_HISTORY = 32
+
+# Seconds to wait for an MCP call before giving up, so a hung server
+# can't block the Streamlit script thread forever
+MCP_CALL_TIMEOUT = 30
+
+# Seconds to wait for a connection to disconnect and for its loop thread to
+# stop when closing it, so shutdown can't hang on a stuck server
+MCP_CLOSE_TIMEOUT = 5
+
+# Seconds a freshly started MCP server must stay up, and how often to check it
+SERVER_START_TIMEOUT = 2.0
+SERVER_POLL_INTERVAL = 0.05
+
+# Issue types offered by the Create Ticket form
+ISSUE_TYPES = ("Task", "Bug", "Story", "Epic", "Improvement")
+
+# Regex patterns used to parse chat requests, compiled once at import
+
+# Ticket fields for extract_ticket_info (project is also used by chat search)
+PROJECT_RE = re.compile(r'(?:project\s+(?:key\s+)?|in\s+)(?:"|\')?([A-Z0-9]+)(?:"|\')?\b|project\s*[=:]\s*(?:"|\')?([A-Z0-9]+)(?:"|\')?', re.IGNORECASE)
+SUMMARY_RE = re.compile(r'(?:title|summary)[=:]?\s*["\']([^"\']+?)["\']|(?:title|summary)[=:]?\s*([^,\.]+)', re.IGNORECASE)
+DESCRIPTION_RE = re.compile(r'description[=:]?\s*["\']([^"\']+?)["\']|description[=:]?\s*([^,\.]+)', re.IGNORECASE)
+ISSUE_TYPE_RE = re.compile(r'(?:create|add)\s+(?:a|an)?\s+([Bb]ug|[Tt]ask|[Ss]tory|[Ee]pic|[Ii]mprovement)|type[=:]?\s*["\']?([A-Za-z]+)["\']?', re.IGNORECASE)
+ASSIGN_TO_RE = re.compile(r'assign\s+(it\s+)?to\s+([A-Za-z]+(?:\s+[A-Za-z]+)?)', re.IGNORECASE)
+# All ticket fields in one pattern; each is a lookahead so fields may overlap,
+# and the first match of each name equals that field's own search()
+TICKET_FIELD_RES = {
+    "project": PROJECT_RE,
+    "summary": SUMMARY_RE,
+    "description": DESCRIPTION_RE,
+    "issue_type": ISSUE_TYPE_RE,
+    "assignee": ASSIGN_TO_RE,
+}
+TICKET_FIELDS_RE = re.compile("|".join(f"(?=(?P<{name}>{regex.pattern}))" for name, regex in TICKET_FIELD_RES.items()), re.IGNORECASE)
+
+# Issue type keywords used when no explicit type is given, in order of precedence
+ISSUE_TYPE_KEYWORD_RE = re.compile(r'\b([Bb]ug|[Tt]ask|[Ss]tory|[Ee]pic)\b')
+ISSUE_TYPE_KEYWORDS = ("Bug", "Task", "Story", "Epic")
+
+# Chat intent detection. Patterns that only test intent are matched against the
+# lowercased input, so they are written in lowercase without re.IGNORECASE.
+CREATE_INTENT_RE = re.compile(r'create\s+(a|new)?\s*(ticket|task|bug|story|epic)')
+SEARCH_INTENT_RE = re.compile(r'(find|search|list|show)\s+(all|open|recent)?\s*(tickets|issues|tasks)'
+                              r'|(find|search|list|show)\s+(all|open|recent)?\s*(tickets|issues|tasks|bugs)(\s+.*?\s+|.*?\s+)(assign|assign.*?to|by|from|of|contain|containing|with|about|related|to)\s+(\w+\s+\w+|\w+)')
+
+# Search filters
+ASSIGNEE_RE = re.compile(r'(assign|assign.*?to|by|from|of)\s+([A-Za-z]+\s+[A-Za-z]+|[A-Za-z]+)', re.IGNORECASE)
+CONTENT_RE = re.compile(r'contain(?:ing|s)?\s+["\'"]?([^"\']+)["\'"]?|about\s+["\'"]?([^"\']+)["\'"]?|with\s+["\'"]?([^"\']+)["\'"]?|related\s+to\s+["\'"]?([^"\']+)["\'"]?', re.IGNORECASE)
+JQL_QUERY_RE = re.compile(r'(?:query:|using query:)\s*(project\s*=\s*[A-Z0-9]+.+)', re.IGNORECASE)
+JQL_ISSUE_TYPE_RE = re.compile(r'(?:type|issuetype)\s*[=:]\s*["\']?([A-Za-z]+)["\']?', re.IGNORECASE)
+
+# Ticket details requests
+DETAILS_BY_ID_RE = re.compile(r'(details|info|status|fetch|get|show|display|view|retrieve)\s+(details\s+)?(of|for|about)?\s*(ticket|issue)?:?\s*([A-Z]+-\d+)', re.IGNORECASE)
+ID_DETAILS_RE = re.compile(r'(?<![A-Z])([A-Z]+-\d+).*?(details|info|status)', re.IGNORECASE)
+DETAILS_CREATED_RE = re.compile(r'(details|info|status|fetch|get|show|display|view|retrieve).*?(the|this|that|our)?\s*(ticket|issue)?\s*(we|you|i)?\s*(just)?\s*(created|made)')
+DETAILS_TOPIC_RE = re.compile(r'(details|info|status).*?(oauth2|authentication|ticket)')
+# A ticket ID can only start where a run of letters starts, so the lookbehind skips
+# the other positions instead of backtracking through long words from each one
+TICKET_ID_RE = re.compile(r'(?<![A-Z])([A-Z]+-\d+)', re.IGNORECASE)
+CREATED_REF_RE = re.compile(r'(created|made)')
+CREATED_TICKET_RE = re.compile(r'Ticket created: ([A-Z]+-\d+)')
+OAUTH_REF_RE = re.compile(r'(oauth2|authentication)')
+
+# Chat intents in priority order, fused so one anchored match of the lowercased
+# input finds the first intent whose pattern occurs anywhere in it. Each
+# lookahead is followed by an empty named group that reports the winner.
+CHAT_INTENTS = (
+    ("create", CREATE_INTENT_RE.pattern),
+    ("search", "query:|" + SEARCH_INTENT_RE.pattern),
+    ("details", f"(?i:{DETAILS_BY_ID_RE.pattern})|(?i:{ID_DETAILS_RE.pattern})|{DETAILS_CREATED_RE.pattern}|{DETAILS_TOPIC_RE.pattern}"),
+)
+CHAT_INTENT_RE = re.compile("|".join(f"(?=(?s:.*?)(?:{pattern}))(?P<{name}>)" for name, pattern in CHAT_INTENTS))
+
+# Tickets assigned to someone or containing text
+TICKETS_ASSIGN_RE = re.compile(r'(tickets|tasks|issues|bugs)(\s+.*?\s+|.*?\s+)(assign|assign.*?to|by|from|of)\s+([A-Za-z]+\s+[A-Za-z]+|[A-Za-z]+)', re.IGNORECASE)
+TICKETS_CONTENT_RE = re.compile(r'(tickets|tasks|issues|bugs)(\s+.*?\s+|.*?\s+)(contain|containing|with|about|related\s+to)\s+["\']?([^"\']+)["\']?', re.IGNORECASE)
+TICKETS_PROJECT_RE = re.compile(r'(?:project|in)\s+(?:the\s+)?(?:"|\')?([A-Z0-9]+)(?:"|\')?(?:\s+project)?', re.IGNORECASE)
+TICKET_MENTION_RE = re.compile(r'(description|details|info)\s+(?:of|for|about)?\s*(?:the)?\s*(?:ticket|issue)?\s*(?:we|you)?\s*(?:just)?\s*created')
+
+# Chat responses, filled in with str.format
+CREATE_FAILED_RESPONSE = """
+I tried to create a ticket based on your request, but I need more information:
+
+{result}
+
+Please try again with more details.
+"""
+
+CREATE_ERROR_RESPONSE = """
+I encountered an error while creating the ticket:
+{error}
+
+Please try again in a moment.
+"""
+
+CREATED_RESPONSE = """
+Great! I've created the ticket for you:
+
+{result}
+
+Is there anything else you'd like me to do?
+"""
+
+SEARCH_RESULTS_RESPONSE = """
+Here are the tickets I found:
+
+{result}
+
+Is there anything specific you'd like to know about any of these tickets?
+"""
+
+SEARCH_ERROR_RESPONSE = """
+I encountered an error while searching for tickets:
+{error}
+
+Please check your search query and try again. Here are some example queries you can try:
+- "Find all open tickets in KAN"
+- "Search for tickets in project KAN"
+- "Show me tickets containing 'authentication'"
+"""
+
+TICKET_DETAILS_RESPONSE = """
+Here are the details for ticket {ticket_id}:
+
+{result}
+
+Is there anything else you'd like to know?
+"""
+
+TICKET_DETAILS_ERROR_RESPONSE = """
+I encountered an error while retrieving ticket {ticket_id}:
+{error}
+
+Please check the ticket ID and try again.
+"""
+
+ASSIGNEE_RESULTS_RESPONSE = """
+Here are the tickets assigned to {assignee}:
+
+{result}
+
+Is there anything specific you'd like to know about any of these tickets?
+"""
+
+ASSIGNEE_ERROR_RESPONSE = """
+I encountered an error while searching for tickets assigned to {assignee}:
+{error}
+
+Please check the assignee name and try again.
+"""
+
+CONTENT_RESULTS_RESPONSE = """
+Here are the tickets containing '{search_text}':
+
+{result}
+
+Is there anything specific you'd like to know about any of these tickets?
+"""
+
+CONTENT_ERROR_RESPONSE = """
+I encountered an error while searching for tickets containing '{search_text}':
+{error}
+
+Please try a different search term or query format.
+"""
+
+CREATED_TICKET_DETAILS_RESPONSE = """
+Here are the details for the ticket you just created ({ticket_id}):
+
+{result}
+
+Is there anything else you'd like to know?
+"""
+
+# Greeting shown when the chat starts
+DEFAULT_HELP_MESSAGE = """
+👋 Welcome to Jira Assistant! I'm here to help you manage your Jira tickets efficiently.
+
+Here are some things you can ask me to do:
+
+1. Create a new ticket: 
+   - "Create a bug in KAN titled 'Login page crashes' with description 'The login page crashes on Safari'"
+
+2. Search for tickets: 
+   - "Search for tickets in project KAN" 
+   - "Find all open tickets"
+   - "project = KAN AND issuetype = Task" (direct JQL query)
+
+3. Get ticket details: 
+   - "Show details for ticket KAN-123"
+   - "Get info about KAN-123"
+   - "Fetch details of ticket KAN-123"
+
+What would you like to do today?
+"""
+
 # Configure page appearance
 st.set_page_config(
     page_title="Jira Assistant",
@@ -31,143 +272,360 @@ st.set_page_config(
 
 # Check if a process is running based on a command pattern
 def is_process_running(pattern):
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+    # Only cmdline is needed; one substring test on the joined args per process
+    for proc in psutil.process_iter(attrs=['cmdline']):
         try:
-            cmdline = proc.info.get('cmdline', [])
-            if cmdline and any(pattern in cmd for cmd in cmdline if cmd):
+            cmdline = proc.info['cmdline']
+            if cmdline and pattern in " ".join(cmdline):
                 return True
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             pass
     return False
 
-# Function to start the MCP server
-def start_mcp_server():
+# Check if the MCP server is running, reusing the result across quick reruns
+def is_mcp_server_running():
+    now = time.monotonic()
+    cached = st.session_state.get("mcp_running")
+    if cached and now - cached[0] < SERVER_STATUS_TTL:
+        return cached[1]
+    
+    running = is_process_running("mcp_server.py")
+    st.session_state.mcp_running = (now, running)
+    return running
+
+# Function to start the MCP server. Once this session has started it, trust
+# that instead of scanning the process table again unless force is set.
+def start_mcp_server(force=False):
+    if not force and st.session_state.get("server_started"):
+        return True
+    
     if is_process_running("mcp_server.py"):
         st.sidebar.success("MCP server is already running!")
         return True
     
     try:
         cmd = ["python", MCP_SERVER_PATH]
+        # stdout is never read, so discard it rather than let a full pipe block the server
         process = subprocess.Popen(
             cmd,
-            stdout=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
             text=True,
-            bufsize=1,
-            universal_newlines=True,
         )
         
-        # Give the server some time to start
-        time.sleep(2)
+        # Give the server some time to start, returning early if it exits
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+        while process.poll() is None and time.monotonic() < deadline:
+            time.sleep(SERVER_POLL_INTERVAL)
         
         # Check if the process is still running (didn't crash immediately)
         if process.poll() is None:
             st.sidebar.success("MCP server started successfully!")
             return True
         else:
-            stdout, stderr = process.communicate()
+            _, stderr = process.communicate()
             st.sidebar.error(f"MCP server failed to start: {stderr}")
             return False
     except Exception as e:
         st.sidebar.error(f"Error starting MCP server: {str(e)}")
         return False
 
-# Function to get available tools from the MCP server using the correct approach
-async def get_tools():
+# Open the MCP session and keep it alive until asked to stop. The contexts are
+# entered and exited in this one task, as the stdio transport requires.
+async def hold_mcp_session(ready, stop):
+    # Create server parameters for stdio connection
+    server_params = StdioServerParameters(
+        command="python",  # Executable
+        args=[MCP_SERVER_PATH],  # Path to the MCP server script
+        env=None  # Use current environment
+    )
+    
     try:
-        from mcp import ClientSession, StdioServerParameters
-        from mcp.client.stdio import stdio_client
-        
-        # Create server parameters for stdio connection
-        server_params = StdioServerParameters(
-            command="python",  # Executable
-            args=[MCP_SERVER_PATH],  # Path to the MCP server script
-            env=None  # Use current environment
-        )
-        
         async with stdio_client(server_params) as (read, write):
             async with ClientSession(read, write) as session:
                 # Initialize the connection
                 await session.initialize()
-                
-                # List available tools
-                tools_result = await session.list_tools()
-                
-                # Extract tools from the result
-                if hasattr(tools_result, 'tools'):
-                    return tools_result.tools
-                else:
-                    st.sidebar.warning("Unexpected tools result format")
-                    return []
+                ready.set_result(session)
+                await stop.wait()
+    except Exception as e:
+        if ready.done():
+            raise
+        ready.set_exception(e)
+
+# Run a coroutine on the MCP loop thread with the calling rerun's Streamlit
+# context attached, so it can still use st.session_state and st.sidebar
+async def in_script_context(coro, ctx):
+    add_script_run_ctx(threading.current_thread(), ctx)
+    return await coro
+
+# Persistent MCP client session, reused across tool calls instead of spawning
+# a new server subprocess and handshake for each one. Its event loop runs on a
+# background thread, so the session keeps serving the server between reruns.
+@dataclass
+class MCPConnection:
+    loop: asyncio.AbstractEventLoop
+    thread: threading.Thread
+    ready: Optional[asyncio.Future] = None
+    stop: Optional[asyncio.Event] = None
+    task: Optional[asyncio.Task] = None
+    background: set = field(default_factory=set)
+    
+    @classmethod
+    def start(cls):
+        """Create a connection whose event loop runs forever on a daemon thread"""
+        loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, name="mcp-event-loop", daemon=True)
+        thread.start()
+        return cls(loop, thread)
+    
+    async def get_session(self):
+        """Return the open session, (re)connecting to the MCP server if needed"""
+        # Only start over once the previous attempt's task has finished, so
+        # callers never get a session that isn't ready yet
+        if self.task is None or self.task.done():
+            self.ready = self.loop.create_future()
+            self.stop = asyncio.Event()
+            self.task = self.loop.create_task(hold_mcp_session(self.ready, self.stop))
+        # Every caller waits on the same attempt, shielded so that a caller
+        # timing out doesn't cancel the connection for the others
+        return await asyncio.shield(self.ready)
+    
+    def spawn(self, coro):
+        """Start a task on the loop without waiting for it, from a coroutine running there"""
+        task = self.loop.create_task(coro)
+        # Keep a reference until it finishes so the task isn't garbage collected
+        self.background.add(task)
+        task.add_done_callback(self.background.discard)
+    
+    def run(self, coro, timeout=MCP_CALL_TIMEOUT):
+        """Run a coroutine on the connection's loop thread, giving up after timeout seconds"""
+        future = asyncio.run_coroutine_threadsafe(in_script_context(coro, get_script_run_ctx()), self.loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"The MCP server did not respond within {timeout} seconds") from None
+    
+    async def disconnect(self):
+        """Close the session, stopping its server subprocess"""
+        if self.task is not None and not self.task.done():
+            self.stop.set()
+            await self.task
+    
+    def close(self, timeout=MCP_CLOSE_TIMEOUT):
+        """Disconnect, then stop the loop thread and close the event loop, waiting at most timeout seconds for each"""
+        if self.loop.is_closed():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.disconnect(), self.loop).result(timeout)
+        except Exception:
+            logger.exception("Error disconnecting from the MCP server")
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout)
+        # The loop can only be closed once its thread has stopped running it
+        if not self.thread.is_alive():
+            self.loop.close()
+
+def session_is_active(session_id):
+    """Whether a browser session is still connected (always true outside `streamlit run`)"""
+    return not runtime.exists() or runtime.get_instance().is_active_session(session_id)
+
+def close_connections(connections):
+    """Close each of the given MCP connections in turn"""
+    for conn in connections:
+        conn.close()
+
+# Open MCP connections by browser session id, shared by all sessions in the
+# process. Connections of sessions that have ended are closed when the next one
+# is registered, and the rest when the process exits.
+@dataclass
+class MCPConnectionRegistry:
+    connections: dict = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    
+    def add(self, session_id, conn):
+        """Register a session's connection and close the connections of ended sessions"""
+        with self.lock:
+            self.connections[session_id] = conn
+            ended = [sid for sid in self.connections if not session_is_active(sid)]
+            stale = [self.connections.pop(sid) for sid in ended]
+        if stale:
+            # Close them off the script thread, as each may wait for MCP_CLOSE_TIMEOUT
+            threading.Thread(target=close_connections, args=(stale,), name="mcp-cleanup", daemon=True).start()
+    
+    def close_all(self):
+        """Close every registered connection"""
+        with self.lock:
+            connections = list(self.connections.values())
+            self.connections.clear()
+        close_connections(connections)
+
+# Streamlit reruns this script's module code, so the registry and its exit hook
+# are created once per process through the resource cache
+@st.cache_resource
+def get_mcp_registry():
+    registry = MCPConnectionRegistry()
+    atexit.register(registry.close_all)
+    return registry
+
+# Get this browser session's MCP connection, creating it on first use or
+# after its loop thread has stopped
+def get_mcp_connection():
+    conn = st.session_state.get("mcp_conn")
+    if conn is None or not conn.thread.is_alive():
+        conn = MCPConnection.start()
+        ctx = get_script_run_ctx()
+        get_mcp_registry().add(ctx.session_id if ctx else None, conn)
+        st.session_state.mcp_conn = conn
+    return st.session_state.mcp_conn
+
+# Function to get available tools from the MCP server using the correct approach
+async def get_tools():
+    try:
+        session = await get_mcp_connection().get_session()
+        
+        # List available tools
+        tools_result = await session.list_tools()
+        
+        # Extract tools from the result
+        if hasattr(tools_result, 'tools'):
+            return tools_result.tools
+        else:
+            st.sidebar.warning("Unexpected tools result format")
+            return []
     except Exception as e:
         st.sidebar.error(f"Error getting tools: {str(e)}")
         return []
 
+# Get the text of an MCP tool result
+def tool_result_text(result):
+    # Extract content from the result
+    if hasattr(result, 'content') and result.content:
+        # Extract text from the first content item
+        content_item = result.content[0]
+        if hasattr(content_item, 'text'):
+            return content_item.text
+    
+    return str(result)
+
 # Function to call an MCP tool
 async def call_tool(tool_name, params):
     try:
-        from mcp import ClientSession, StdioServerParameters
-        from mcp.client.stdio import stdio_client
-        
-        # Create server parameters for stdio connection
-        server_params = StdioServerParameters(
-            command="python",  # Executable
-            args=[MCP_SERVER_PATH],  # Path to the MCP server script
-            env=None  # Use current environment
-        )
+        session = await get_mcp_connection().get_session()
         
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                # Initialize the connection
-                await session.initialize()
-                
-                # Call the tool
-                result = await session.call_tool(tool_name, arguments=params)
-                
-                # Extract content from the result
-                if hasattr(result, 'content') and result.content:
-                    # Extract text from the first content item
-                    content_item = result.content[0]
-                    if hasattr(content_item, 'text'):
-                        return content_item.text
-                
-                return str(result)
+        # Call the tool
+        result = await session.call_tool(tool_name, arguments=params)
+        return tool_result_text(result)
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("Error calling tool %s", tool_name)
         st.error(f"Error calling tool: {str(e)}")
         return f"Error: {str(e)}"
 
+# Read-only tool results are cached per browser session for TOOL_CACHE_TTL,
+# keyed by tool name and arguments
+def tool_cache_key(tool_name, params):
+    return (tool_name, tuple(sorted(params.items())))
+
+# A session's cached tool results. Prefetch tasks keep writing to it after the
+# rerun that started them has returned, so every access holds the lock.
+@dataclass
+class ToolCache:
+    entries: OrderedDict = field(default_factory=OrderedDict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    
+    def get(self, key, now):
+        """Return a cached result younger than TOOL_CACHE_TTL, or None"""
+        with self.lock:
+            cached = self.entries.get(key)
+            if cached and now - cached[0] < TOOL_CACHE_TTL:
+                self.entries.move_to_end(key)
+                return cached[1]
+        return None
+    
+    def put(self, key, now, result):
+        """Cache a result, skipping errors and dropping the oldest entry beyond TOOL_CACHE_SIZE"""
+        if result.startswith("Error"):
+            return
+        with self.lock:
+            self.entries[key] = (now, result)
+            self.entries.move_to_end(key)
+            if len(self.entries) > TOOL_CACHE_SIZE:
+                self.entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop every cached result"""
+        with self.lock:
+            self.entries.clear()
+
+# Call a read-only MCP tool, reusing a recently fetched result
+async def call_tool_cached(tool_name, params):
+    cache = st.session_state.tool_cache
+    key = tool_cache_key(tool_name, params)
+    now = time.monotonic()
+    cached = cache.get(key, now)
+    if cached is not None:
+        return cached
+    
+    result = await call_tool(tool_name, params)
+    cache.put(key, now, result)
+    return result
+
+# Fetch the details of a search's first tickets with one get_jira_tickets call
+# into the cache, so a follow-up "details for KAN-12" doesn't need another
+# round trip. Failures are ignored; the ticket is simply fetched again on request.
+async def prefetch_ticket_details(session, cache, ticket_ids):
+    now = time.monotonic()
+    missing = [
+        ticket_id for ticket_id in ticket_ids
+        if cache.get(tool_cache_key("get_jira_ticket", {"issue_key": ticket_id}), now) is None
+    ]
+    if not missing:
+        return
+    try:
+        result = await session.call_tool("get_jira_tickets", arguments={"issue_keys": missing})
+        tickets = json.loads(tool_result_text(result))
+    except Exception:
+        return
+    now = time.monotonic()
+    for ticket in tickets:
+        # Cache the same text get_jira_ticket returns for a single ticket
+        text = f"Ticket {ticket['key']}: {ticket.get('summary')} - {ticket.get('status')}"
+        cache.put(tool_cache_key("get_jira_ticket", {"issue_key": ticket["key"]}), now, text)
+
 # Helper function to extract ticket information using regex
 def extract_ticket_info(text):
-    # Try to extract project, summary, description, issue_type, and assignee with improved regex
-    project_match = re.search(r'(?:project\s+(?:key\s+)?|in\s+)(?:"|\')?([A-Z0-9]+)(?:"|\')?\b|project\s*[=:]\s*(?:"|\')?([A-Z0-9]+)(?:"|\')?', text, re.IGNORECASE)
-    summary_match = re.search(r'(?:title|summary)[=:]?\s*["\']([^"\']+?)["\']|(?:title|summary)[=:]?\s*([^,\.]+)', text, re.IGNORECASE)
-    description_match = re.search(r'description[=:]?\s*["\']([^"\']+?)["\']|description[=:]?\s*([^,\.]+)', text, re.IGNORECASE)
-    issue_type_match = re.search(r'(?:create|add)\s+(?:a|an)?\s+([Bb]ug|[Tt]ask|[Ss]tory|[Ee]pic|[Ii]mprovement)|type[=:]?\s*["\']?([A-Za-z]+)["\']?', text, re.IGNORECASE)
-    assignee_match = re.search(r'assign\s+(it\s+)?to\s+([A-Za-z]+(?:\s+[A-Za-z]+)?)', text, re.IGNORECASE)
+    # Extract project, summary, description, issue_type, and assignee in one scan,
+    # keeping the sub-groups of the first match of each field
+    fields = {}
+    for match in TICKET_FIELDS_RE.finditer(text):
+        name = match.lastgroup
+        if name not in fields:
+            index = TICKET_FIELDS_RE.groupindex[name]
+            fields[name] = match.groups()[index:index + TICKET_FIELD_RES[name].groups]
+            if len(fields) == len(TICKET_FIELD_RES):
+                break
     
-    project = project_match.group(1) or project_match.group(2) if project_match else None
-    summary = (summary_match.group(1) or summary_match.group(2)).strip() if summary_match else None
-    description = (description_match.group(1) or description_match.group(2)).strip() if description_match else None
+    project_groups = fields.get("project")
+    summary_groups = fields.get("summary")
+    description_groups = fields.get("description")
+    issue_type_groups = fields.get("issue_type")
+    assignee_groups = fields.get("assignee")
+    
+    project = project_groups[0] or project_groups[1] if project_groups else None
+    summary = (summary_groups[0] or summary_groups[1]).strip() if summary_groups else None
+    description = (description_groups[0] or description_groups[1]).strip() if description_groups else None
     
     # More robust issue type detection
     issue_type = None
-    if issue_type_match:
-        issue_type = (issue_type_match.group(1) or issue_type_match.group(2)).title() if issue_type_match else None
+    if issue_type_groups:
+        issue_type = (issue_type_groups[0] or issue_type_groups[1]).title()
     else:
-        # Check for specific keywords in the text
-        if re.search(r'\b[Bb]ug\b', text):
-            issue_type = "Bug"
-        elif re.search(r'\b[Tt]ask\b', text):
-            issue_type = "Task"
-        elif re.search(r'\b[Ss]tory\b', text):
-            issue_type = "Story"
-        elif re.search(r'\b[Ee]pic\b', text):
-            issue_type = "Epic"
-        else:
-            issue_type = "Task"  # Default to Task
+        # Check for specific keywords in the text in a single scan, defaulting to Task
+        found = {keyword.title() for keyword in ISSUE_TYPE_KEYWORD_RE.findall(text)}
+        issue_type = next((t for t in ISSUE_TYPE_KEYWORDS if t in found), "Task")
     
-    assignee = assignee_match.group(2) if assignee_match else None
+    assignee = assignee_groups[1] if assignee_groups else None
     
     # If no description provided but we have a summary, use a generic description
     if not description and summary:
@@ -182,11 +640,33 @@ def extract_ticket_info(text):
     
     # Add assignee if available
     if assignee:
-        print(f"DEBUG - Adding assignee: {assignee}")
+        if DEBUG_MODE:
+            print(f"DEBUG - Adding assignee: {assignee}")
         ticket_info["assignee"] = assignee
     
     return ticket_info
 
+# Remember the key of a newly created ticket so follow-up requests like
+# "details of the ticket we just created" don't have to search the chat. The
+# OAuth2/authentication references in the request text are kept as its tags.
+def remember_created_ticket(result, text):
+    ticket_match = CREATED_TICKET_RE.search(result)
+    if ticket_match:
+        tags = frozenset(OAUTH_REF_RE.findall(text.lower()))
+        st.session_state.ticket_index.append((ticket_match.group(1), tags))
+        # Cached searches may now be missing the new ticket
+        st.session_state.tool_cache.clear()
+
+# Get the most recently created ticket, preferring one about OAuth2 or
+# authentication when auth_related is set
+def find_created_ticket(auth_related=False):
+    ticket_index = st.session_state.ticket_index
+    if auth_related:
+        ticket_id = next((ticket_id for ticket_id, tags in reversed(ticket_index) if tags), None)
+        if ticket_id:
+            return ticket_id
+    return ticket_index[-1][0] if ticket_index else None
+
 # Function to handle ticket creation from natural language
 async def create_jira_ticket_from_text(text):
     ticket_info = extract_ticket_info(text)
@@ -205,25 +685,29 @@ async def create_jira_ticket_from_text(text):
         return f"Error: Could not determine the following fields: {', '.join(missing_fields)}. Please provide all required information."
     
     # Print the ticket info for debugging
-    print(f"Creating ticket with: {json.dumps(ticket_info, indent=2)}")
+    if DEBUG_MODE:
+        print(f"Creating ticket with: {json.dumps(ticket_info, indent=2)}")
     
     # Create ticket
     result = await call_tool("create_jira_ticket", ticket_info)
+    remember_created_ticket(result, text)
     return result
 
 # Function to search for Jira tickets
 async def search_jira_tickets(query, max_results=10):
     params = {
-        "query": query  # Changed from "jql_query" to "query" to match the MCP server's expectation
+        "query": query.strip(),  # Changed from "jql_query" to "query" to match the MCP server's expectation
+        "max_results": max_results
     }
     
     try:
-        result = await call_tool("search_jira_tickets", params)
+        result = await call_tool_cached("search_jira_tickets", params)
         # Check if the result contains an error
         if result.startswith('Error:') or 'errorMessages' in result:
             error_data = None
             try:
-                error_data = json.loads(result.replace('Error:', '').strip())
+                error_body = result[len('Error:'):] if result.startswith('Error:') else result
+                error_data = json.loads(error_body.strip())
             except json.JSONDecodeError:
                 return f"Error: {result}"
                 
@@ -238,162 +722,36 @@ async def search_jira_tickets(query, max_results=10):
                     return f"Error: {error_msg}"
             else:
                 return result
+        
+        # Fetch details for the top results in the background
+        ticket_ids = TICKET_ID_RE.findall(result)[:PREFETCH_TICKET_DETAILS]
+        if ticket_ids:
+            conn = get_mcp_connection()
+            conn.spawn(prefetch_ticket_details(await conn.get_session(), st.session_state.tool_cache, ticket_ids))
         return result
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("Error searching tickets")
         return f"Error: {str(e)}"
 
-# Function to get the default help message
-def get_default_help_message():
-    return f"""
-👋 Welcome to Jira Assistant! I'm here to help you manage your Jira tickets efficiently.
-
-Here are some things you can ask me to do:
-
-1. Create a new ticket: 
-   - "Create a bug in KAN titled 'Login page crashes' with description 'The login page crashes on Safari'"
-
-2. Search for tickets: 
-   - "Search for tickets in project KAN" 
-   - "Find all open tickets"
-   - "project = KAN AND issuetype = Task" (direct JQL query)
-
-3. Get ticket details: 
-   - "Show details for ticket KAN-123"
-   - "Get info about KAN-123"
-   - "Fetch details of ticket KAN-123"
-
-What would you like to do today?
-"""
-
 # Function to get a Jira ticket by ID
 async def get_jira_ticket(ticket_id):
     params = {
         "issue_key": ticket_id  # Changed from "ticket_id" to "issue_key" to match the MCP server's expectation
     }
     
-    result = await call_tool("get_jira_ticket", params)
+    result = await call_tool_cached("get_jira_ticket", params)
     return result
 
+# Read the app stylesheet once; later reruns reuse the cached string
+@st.cache_data
+def load_css():
+    with open(CSS_PATH) as f:
+        return f.read()
+
 # Main function to set up the Streamlit app
 def main():
     # Custom CSS for a cleaner UI
-    st.markdown("""
-    <style>
-    .main {
-        padding: 2rem;
-    }
-    .stButton button {
-        width: 100%;
-    }
-    .small-text {
-        font-size: 14px;
-    }
-    .tool-box {
-        border: 1px solid #e0e0e0;
-        border-radius: 5px;
-        padding: 10px;
-        margin-bottom: 10px;
-    }
-    .success-box {
-        background-color: #f0fff4;
-        border: 1px solid #9ae6b4;
-        border-radius: 5px;
-        padding: 10px;
-        margin-bottom: 10px;
-    }
-    .error-box {
-        background-color: #fff5f5;
-        border: 1px solid #feb2b2;
-        border-radius: 5px;
-        padding: 10px;
-        margin-bottom: 10px;
-    }
-    /* Make chat input fixed at bottom with improved positioning */
-    .stChatFloatingInputContainer {
-        position: fixed !important;
-        bottom: 0 !important;
-        left: 0 !important;
-        padding: 1rem !important;
-        padding-bottom: 0.5rem !important;
-        width: 100% !important;
-        background-color: white !important;
-        z-index: 999 !important;
-        border-top: 1px solid #e6e9ef !important;
-        box-shadow: 0px -4px 10px rgba(0, 0, 0, 0.05) !important;
-    }
-    /* Format chat messages */
-    .stChatMessage {
-        max-width: 100%;
-        overflow-wrap: break-word;
-        margin-bottom: 15px !important;
-    }
-    /* Fixed height scrollable container for chat */
-    .chat-container {
-        height: auto !important;
-        overflow-y: visible !important;
-        overflow-x: hidden !important;
-        margin-top: 0 !important;
-        padding-top: 0 !important;
-        position: relative !important;
-    }
-    /* Force the chat interface to be at the top */
-    .stChatContainer {
-        margin-top: 0 !important;
-        padding-top: 0 !important;
-    }
-    /* Hide technical information in sidebar */
-    .css-17ziqus {
-        visibility: hidden;
-    }
-    /* Ensure spacing between messages */
-    .message-spacer {
-        height: 15px;
-        width: 100%;
-        display: block;
-    }
-    /* Chat footer to reserve space */
-    .chat-footer-space {
-        height: 150px;
-        width: 100%;
-        display: block;
-    }
-    /* Remove extra margins from the chat header elements */
-    .chat-header h3, .chat-header p {
-        margin-top: 0 !important;
-        margin-bottom: 8px !important;
-    }
-    /* Force no padding on the tab container */
-    .stTabs [data-baseweb=tab-panel] {
-        padding-top: 0 !important;
-    }
-    /* Reset the layout for the entire chat interface */
-    section[data-testid="stSidebar"] ~ div[data-testid="stVerticalBlock"] div[data-testid="stVerticalBlock"] {
-        gap: 0 !important;
-    }
-    /* Streamlit vertical block override for chat */
-    div[data-testid="stVerticalBlock"] > div[style*="flex-direction: column"] > div[data-testid="stVerticalBlock"] {
-        gap: 0 !important;
-    }
-    /* Tabs styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 24px;
-    }
-    .stTabs [data-baseweb="tab"] {
-        height: 50px;
-        white-space: pre-wrap;
-        background-color: transparent;
-        border-radius: 4px 4px 0 0;
-        gap: 1px;
-        padding-top: 10px;
-        padding-bottom: 10px;
-    }
-    .stTabs [aria-selected="true"] {
-        background-color: #f0f2f6;
-        border-bottom: 2px solid #4059AD;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
     
     # Create a clean header
     col1, col2 = st.columns([3, 1])
@@ -405,18 +763,13 @@ def main():
     st.sidebar.title("📊 Status")
     
     # Hide technical details in production mode
-    if os.getenv("DEBUG_MODE", "false").lower() == "true":
-        try:
-            import mcp
-            mcp_path = mcp.__file__
-            mcp_version = getattr(mcp, "__version__", "unknown")
-            st.sidebar.info(f"MCP version: {mcp_version}")
-            st.sidebar.info(f"MCP path: {mcp_path}")
-        except ImportError:
-            st.sidebar.error("MCP package not properly installed")
+    if DEBUG_MODE:
+        mcp_version = getattr(mcp, "__version__", "unknown")
+        st.sidebar.info(f"MCP version: {mcp_version}")
+        st.sidebar.info(f"MCP path: {mcp.__file__}")
     
     # Connection status indicator - simplified
-    server_status = "🟢 Connected" if is_process_running("mcp_server.py") else "🔴 Disconnected"
+    server_status = "🟢 Connected" if is_mcp_server_running() else "🔴 Disconnected"
     st.sidebar.success(server_status)
     
     # Initialize session state
@@ -440,29 +793,31 @@ def main():
             "issue_type": "Task"
         }
     
+    if "ticket_index" not in st.session_state:
+        st.session_state.ticket_index = deque(maxlen=CREATED_TICKET_HISTORY)
+    
+    if "tool_cache" not in st.session_state:
+        st.session_state.tool_cache = ToolCache()
+    
     # Start MCP server on app startup if it's not already running
-    if not st.session_state.server_started:
-        st.session_state.server_started = start_mcp_server()
+    st.session_state.server_started = start_mcp_server()
     
     # Button to restart the server - only show in debug mode
-    if os.getenv("DEBUG_MODE", "false").lower() == "true":
+    if DEBUG_MODE:
         if st.sidebar.button("🔄 Restart MCP Server"):
-            st.session_state.server_started = start_mcp_server()
+            st.session_state.server_started = start_mcp_server(force=True)
     
     # Get available tools
     if st.session_state.server_started and not st.session_state.tools:
         try:
             # Get tools using the async function
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            st.session_state.tools = loop.run_until_complete(get_tools())
-            loop.close()
+            st.session_state.tools = get_mcp_connection().run(get_tools())
         except Exception as e:
-            if os.getenv("DEBUG_MODE", "false").lower() == "true":
+            if DEBUG_MODE:
                 st.sidebar.error(f"Failed to get tools: {str(e)}")
     
     # Display available tools - only in debug mode
-    if os.getenv("DEBUG_MODE", "false").lower() == "true":
+    if DEBUG_MODE:
         st.sidebar.subheader("🛠️ Available Tools")
         if st.session_state.tools:
             for tool in st.session_state.tools:
@@ -475,10 +830,7 @@ def main():
             if st.sidebar.button("🔄 Refresh Tools"):
                 try:
                     # Get tools using the async function
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    st.session_state.tools = loop.run_until_complete(get_tools())
-                    loop.close()
+                    st.session_state.tools = get_mcp_connection().run(get_tools())
                 except Exception as e:
                     st.sidebar.error(f"Failed to refresh tools: {str(e)}")
     
@@ -500,49 +852,6 @@ def main():
     
     # Tab 1: Chat Interface
     with tab1:
-        # Force the chat to stay at the top with CSS
-        st.markdown("""
-        <style>
-        /* Force the chat interface to top position */
-        .main .block-container {
-            padding-top: 0 !important;
-            padding-bottom: 0 !important;
-            margin-top: 0 !important;
-            margin-bottom: 0 !important;
-        }
-        
-        /* Target all vertical blocks to remove margins/padding */
-        [data-testid="stVerticalBlock"] {
-            gap: 0 !important;
-            padding-top: 0 !important;
-            margin-top: 0 !important;
-        }
-        
-        /* Target the chat container to avoid unwanted space */
-        .element-container, .stMarkdown {
-            margin-top: 0 !important;
-            padding-top: 0 !important;
-            margin-bottom: 0 !important;
-        }
-        
-        /* Force tabs content to top */
-        .stTabs [data-baseweb=tab-panel] {
-            padding-top: 0 !important;
-        }
-        
-        /* Custom chat styles */
-        .chat-header {
-            margin-bottom: 0 !important;
-            padding-bottom: 0 !important;
-        }
-        
-        /* Target the actual chat messages section */
-        .stChatMessage {
-            margin-top: 0 !important;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-        
         # Create compact header with minimal spacing
         st.markdown('<div class="chat-header">', unsafe_allow_html=True)
         st.markdown("### Chat with Jira Assistant")
@@ -552,11 +861,11 @@ def main():
         # Insert fake messages at the top to begin with content
         if not st.session_state.messages:
             st.session_state.messages = [
-                {"role": "assistant", "content": get_default_help_message()}
+                {"role": "assistant", "content": DEFAULT_HELP_MESSAGE}
             ]
         
         # Display messages immediately after header
-        for i, message in enumerate(st.session_state.messages):
+        for message in st.session_state.messages:
             with st.chat_message(message["role"]):
                 st.markdown(message["content"])
         
@@ -575,119 +884,83 @@ def main():
                 response_placeholder = st.empty()
                 response_placeholder.markdown("Processing your request...")
                 
+                lowered = user_input.lower()
+                intent_match = CHAT_INTENT_RE.match(lowered)
+                intent = intent_match.lastgroup if intent_match else None
+                
                 # Check if it's a ticket creation request
-                if re.search(r'create\s+(a|new)?\s*(ticket|task|bug|story|epic)', user_input, re.IGNORECASE):
+                if intent == "create":
                     response_placeholder.markdown("Creating a ticket based on your request...")
                     
                     with st.spinner("Processing ticket creation..."):
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        result = loop.run_until_complete(create_jira_ticket_from_text(user_input))
-                        loop.close()
-                    
-                    if "Error:" in result:
-                        response = f"""
-I tried to create a ticket based on your request, but I need more information:
-
-{result}
-
-Please try again with more details.
-"""
-                    else:
-                        response = f"""
-Great! I've created the ticket for you:
-
-{result}
-
-Is there anything else you'd like me to do?
-"""
+                        try:
+                            result = get_mcp_connection().run(create_jira_ticket_from_text(user_input))
+                            
+                            if "Error:" in result:
+                                response = CREATE_FAILED_RESPONSE.format(result=result)
+                            else:
+                                response = CREATED_RESPONSE.format(result=result)
+                        except Exception as e:
+                            logger.exception("Create error in chat")
+                            response = CREATE_ERROR_RESPONSE.format(error=e)
                 
                 # Check if it's a search request
-                elif re.search(r'(find|search|list|show)\s+(all|open|recent)?\s*(tickets|issues|tasks|bugs)(\s+.*?\s+|.*?\s+)(assign|assign.*?to|by|from|of|contain|containing|with|about|related|to)\s+(\w+\s+\w+|\w+)', user_input, re.IGNORECASE) or re.search(r'(find|search|list|show)\s+(all|open|recent)?\s*(tickets|issues|tasks)', user_input, re.IGNORECASE) or "query:" in user_input.lower():
+                elif intent == "search":
                     response_placeholder.markdown("Searching for tickets based on your request...")
                     
                     # Extract assignee if mentioned
-                    assignee_match = re.search(r'(assign|assign.*?to|by|from|of)\s+([A-Za-z]+\s+[A-Za-z]+|[A-Za-z]+)', user_input, re.IGNORECASE)
+                    assignee_match = ASSIGNEE_RE.search(user_input)
                     assignee = assignee_match.group(2) if assignee_match else None
                     
                     # Extract text content if looking for tickets containing text
-                    content_match = re.search(r'contain(?:ing|s)?\s+["\'"]?([^"\']+)["\'"]?|about\s+["\'"]?([^"\']+)["\'"]?|with\s+["\'"]?([^"\']+)["\'"]?|related\s+to\s+["\'"]?([^"\']+)["\'"]?', user_input, re.IGNORECASE)
+                    content_match = CONTENT_RE.search(user_input)
                     search_text = None
                     if content_match:
                         search_text = next((g for g in content_match.groups() if g is not None), None)
                     
                     # Check if the user input already contains a well-formatted JQL query
-                    jql_pattern = re.search(r'(?:query:|using query:)\s*(project\s*=\s*[A-Z0-9]+.+)', user_input, re.IGNORECASE)
+                    jql_pattern = JQL_QUERY_RE.search(user_input)
                     if jql_pattern:
                         # Use the provided JQL directly
                         jql_query = jql_pattern.group(1).strip()
-                        print(f"Using provided JQL: {jql_query}")
+                        if DEBUG_MODE:
+                            print(f"Using provided JQL: {jql_query}")
                     else:
                         # Extract project if mentioned
-                        project_match = re.search(r'(?:project\s+(?:key\s+)?|in\s+)(?:"|\')?([A-Z0-9]+)(?:"|\')?\b|project\s*[=:]\s*(?:"|\')?([A-Z0-9]+)(?:"|\')?', user_input, re.IGNORECASE)
+                        project_match = PROJECT_RE.search(user_input)
                         project = project_match.group(1) or project_match.group(2) if project_match else None
                         
                         # Check for issue type
-                        issue_type_match = re.search(r'(?:type|issuetype)\s*[=:]\s*["\']?([A-Za-z]+)["\']?', user_input, re.IGNORECASE)
+                        issue_type_match = JQL_ISSUE_TYPE_RE.search(user_input)
                         issue_type = issue_type_match.group(1) if issue_type_match else None
                         
-                        # Build JQL query
-                        jql_parts = []
-                        
-                        if project:
-                            jql_parts.append(f"project = {project}")
-                        
-                        if issue_type:
-                            jql_parts.append(f"issuetype = {issue_type}")
-                        
-                        if assignee:
-                            jql_parts.append(f"assignee = \"{assignee}\"")
-                        
-                        if search_text:
-                            jql_parts.append(f"text ~ \"{search_text}\"")
-                        
-                        if "open" in user_input.lower():
-                            jql_parts.append("status != 'Done' AND status != 'Closed'")
-                        
-                        if jql_parts:
-                            jql_query = " AND ".join(jql_parts)
-                        else:
-                            jql_query = "order by created DESC"
+                        # Build JQL query from the clauses whose condition holds
+                        jql_parts = [clause for condition, clause in (
+                            (project, f"project = {project}"),
+                            (issue_type, f"issuetype = {issue_type}"),
+                            (assignee, f"assignee = \"{assignee}\""),
+                            (search_text, f"text ~ \"{search_text}\""),
+                            ("open" in lowered, "status != 'Done' AND status != 'Closed'"),
+                        ) if condition]
+                        jql_query = " AND ".join(jql_parts) or "order by created DESC"
                     
                     # Store the search context for future reference
                     st.session_state.last_search_query = jql_query
                     
                     with st.spinner("Searching tickets..."):
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
                         try:
-                            result = loop.run_until_complete(search_jira_tickets(jql_query))
+                            result = get_mcp_connection().run(search_jira_tickets(jql_query))
                             
-                            response = f"""
-Here are the tickets I found:
-
-{result}
-
-Is there anything specific you'd like to know about any of these tickets?
-"""
+                            response = SEARCH_RESULTS_RESPONSE.format(result=result)
                         except Exception as e:
-                            print(f"Search error in chat: {traceback.format_exc()}")
-                            response = f"""
-I encountered an error while searching for tickets:
-{str(e)}
-
-Please check your search query and try again. Here are some example queries you can try:
-- "Find all open tickets in KAN"
-- "Search for tickets in project KAN"
-- "Show me tickets containing 'authentication'"
-"""
-                        loop.close()
+                            logger.exception("Search error in chat")
+                            response = SEARCH_ERROR_RESPONSE.format(error=e)
                 
                 # Check if it's a ticket details request by ID or description
-                elif re.search(r'(details|info|status|fetch|get|show|display|view|retrieve)\s+(details\s+)?(of|for|about)?\s*(ticket|issue)?:?\s*([A-Z]+-\d+)', user_input, re.IGNORECASE) or re.search(r'([A-Z]+-\d+).*?(details|info|status)', user_input, re.IGNORECASE) or re.search(r'(details|info|status|fetch|get|show|display|view|retrieve).*?(the|this|that|our)?\s*(ticket|issue)?\s*(we|you|I)?\s*(just)?\s*(created|made)', user_input, re.IGNORECASE) or re.search(r'(details|info|status).*?(oauth2|authentication|ticket)', user_input, re.IGNORECASE):
+                elif intent == "details":
                     
                     # First, check for direct ticket ID in the request
-                    ticket_match = re.search(r'([A-Z]+-\d+)', user_input, re.IGNORECASE)
+                    ticket_match = TICKET_ID_RE.search(user_input)
                     
                     if ticket_match:
                         # Direct ticket ID found
@@ -697,15 +970,11 @@ Please check your search query and try again. Here are some example queries you
                         # Look for contextual references to tickets
                         
                         # Case 1: Reference to "the ticket we just created"
-                        if re.search(r'(created|made)', user_input, re.IGNORECASE):
-                            # Check the most recent ticket creation in the conversation history
-                            for message in reversed(st.session_state.messages):
-                                if "Ticket created:" in message.get("content", ""):
-                                    ticket_match = re.search(r'Ticket created: ([A-Z]+-\d+)', message["content"])
-                                    if ticket_match:
-                                        ticket_id = ticket_match.group(1)
-                                        response_placeholder.markdown(f"Getting details for the ticket you just created ({ticket_id})...")
-                                        break
+                        if CREATED_REF_RE.search(lowered):
+                            # Use the most recent ticket created in this session
+                            ticket_id = find_created_ticket()
+                            if ticket_id:
+                                response_placeholder.markdown(f"Getting details for the ticket you just created ({ticket_id})...")
                             else:
                                 response = "I couldn't find a recently created ticket in our conversation. Could you specify the ticket ID you'd like details for?"
                                 response_placeholder.markdown(response)
@@ -713,16 +982,12 @@ Please check your search query and try again. Here are some example queries you
                                 return
                                 
                         # Case 2: Reference to a ticket by description (e.g., "OAuth2 ticket")
-                        elif re.search(r'(oauth2|authentication)', user_input, re.IGNORECASE):
-                            # Check the most recent search results or conversation for relevant tickets
-                            # For simplicity in the screencast, let's assume this refers to the most recently created ticket
-                            for message in reversed(st.session_state.messages):
-                                if "Ticket created:" in message.get("content", ""):
-                                    ticket_match = re.search(r'Ticket created: ([A-Z]+-\d+)', message["content"])
-                                    if ticket_match:
-                                        ticket_id = ticket_match.group(1)
-                                        response_placeholder.markdown(f"Getting details for the OAuth2 authentication ticket ({ticket_id})...")
-                                        break
+                        elif OAUTH_REF_RE.search(lowered):
+                            # Prefer the latest ticket created from an OAuth2/authentication request,
+                            # falling back to the most recently created ticket
+                            ticket_id = find_created_ticket(auth_related=True)
+                            if ticket_id:
+                                response_placeholder.markdown(f"Getting details for the OAuth2 authentication ticket ({ticket_id})...")
                             else:
                                 response = "I couldn't find a ticket related to OAuth2 or authentication in our conversation. Could you specify the ticket ID you'd like details for?"
                                 response_placeholder.markdown(response)
@@ -735,148 +1000,85 @@ Please check your search query and try again. Here are some example queries you
                             return
                     
                     with st.spinner(f"Retrieving ticket {ticket_id}..."):
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        result = loop.run_until_complete(get_jira_ticket(ticket_id))
-                        loop.close()
-                    
-                    response = f"""
-Here are the details for ticket {ticket_id}:
-
-{result}
-
-Is there anything else you'd like to know?
-"""
+                        try:
+                            result = get_mcp_connection().run(get_jira_ticket(ticket_id))
+                            
+                            response = TICKET_DETAILS_RESPONSE.format(ticket_id=ticket_id, result=result)
+                        except Exception as e:
+                            logger.exception("Ticket details error in chat")
+                            response = TICKET_DETAILS_ERROR_RESPONSE.format(ticket_id=ticket_id, error=e)
                 
                 # Check if user is asking about tickets assigned to someone or containing text
-                elif re.search(r'(tickets|tasks|issues|bugs)(\s+.*?\s+|.*?\s+)(assign|assign.*?to|by|from|of)\s+([A-Za-z]+\s+[A-Za-z]+|[A-Za-z]+)', user_input, re.IGNORECASE) or re.search(r'(tickets|tasks|issues|bugs)(\s+.*?\s+|.*?\s+)(contain|containing|with|about|related\s+to)\s+["\']?([^"\']+)["\']?', user_input, re.IGNORECASE):
-                    assignee_match = re.search(r'(assign|assign.*?to|by|from|of)\s+([A-Za-z]+\s+[A-Za-z]+|[A-Za-z]+)', user_input, re.IGNORECASE)
-                    content_match = re.search(r'(tickets|tasks|issues|bugs)(\s+.*?\s+|.*?\s+)(contain|containing|with|about|related\s+to)\s+["\']?([^"\']+)["\']?', user_input, re.IGNORECASE)
+                # The matches from the check are reused below rather than searched again
+                elif (assignee_match := TICKETS_ASSIGN_RE.search(user_input)) or (content_match := TICKETS_CONTENT_RE.search(user_input)):
+                    # Improved project regex to more reliably detect KAN project, shared by both searches.
+                    # Default to KAN project if not specified
+                    project_match = TICKETS_PROJECT_RE.search(user_input)
+                    project = project_match.group(1) if project_match else "KAN"
                     
                     if assignee_match:
                         assignee = assignee_match.group(4)
-                        # Improved project regex to more reliably detect KAN project
-                        project_match = re.search(r'(?:project|in)\s+(?:the\s+)?(?:"|\')?([A-Z0-9]+)(?:"|\')?(?:\s+project)?', user_input, re.IGNORECASE)
-                        project = project_match.group(1) if project_match else None
-                        
-                        # Build JQL query
-                        jql_parts = []
-                        if project:
-                            jql_parts.append(f"project = {project}")
-                        else:
-                            # Default to KAN project if not specified
-                            jql_parts.append("project = KAN")
-                        
-                        # Fix for assignee search - use exact name for the query
-                        jql_parts.append(f"assignee = \"{assignee}\"")
                         
                         # Check for task/bug specific queries
-                        if "task" in user_input.lower():
-                            jql_parts.append("issuetype = Task")
-                        elif "bug" in user_input.lower():
-                            jql_parts.append("issuetype = Bug")
+                        issue_type = "Task" if "task" in lowered else "Bug" if "bug" in lowered else None
                         
-                        jql_query = " AND ".join(jql_parts)
+                        # Build JQL query, using the exact assignee name
+                        jql_query = f'project = {project} AND assignee = "{assignee}"'
+                        if issue_type:
+                            jql_query += f" AND issuetype = {issue_type}"
                         
-                        print(f"DEBUG - Final JQL query: {jql_query}")
+                        if DEBUG_MODE:
+                            print(f"DEBUG - Final JQL query: {jql_query}")
                         
                         response_placeholder.markdown(f"Searching for tickets assigned to {assignee}...")
                         
                         with st.spinner("Searching tickets..."):
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
                             try:
-                                result = loop.run_until_complete(search_jira_tickets(jql_query))
+                                result = get_mcp_connection().run(search_jira_tickets(jql_query))
                                 
-                                response = f"""
-Here are the tickets assigned to {assignee}:
-
-{result}
-
-Is there anything specific you'd like to know about any of these tickets?
-"""
+                                response = ASSIGNEE_RESULTS_RESPONSE.format(assignee=assignee, result=result)
                             except Exception as e:
-                                print(f"Search error in chat: {traceback.format_exc()}")
-                                response = f"""
-I encountered an error while searching for tickets assigned to {assignee}:
-{str(e)}
-
-Please check the assignee name and try again.
-"""
-                            loop.close()
+                                logger.exception("Search error in chat")
+                                response = ASSIGNEE_ERROR_RESPONSE.format(assignee=assignee, error=e)
                     elif content_match:
                         search_text = content_match.group(4)
-                        project_match = re.search(r'(?:project|in)\s+(?:the\s+)?(?:"|\')?([A-Z0-9]+)(?:"|\')?(?:\s+project)?', user_input, re.IGNORECASE)
-                        project = project_match.group(1) if project_match else None
-                        
-                        # Build JQL query
-                        jql_parts = []
-                        if project:
-                            jql_parts.append(f"project = {project}")
-                        else:
-                            # Default to KAN project if not specified
-                            jql_parts.append("project = KAN")
                         
-                        # Add text search
-                        jql_parts.append(f"text ~ \"{search_text}\"")
+                        # Build JQL query with a text search
+                        jql_query = f'project = {project} AND text ~ "{search_text}"'
                         
-                        jql_query = " AND ".join(jql_parts)
-                        
-                        print(f"DEBUG - Text search JQL query: {jql_query}")
+                        if DEBUG_MODE:
+                            print(f"DEBUG - Text search JQL query: {jql_query}")
                         
                         response_placeholder.markdown(f"Searching for tickets containing '{search_text}'...")
                         
                         with st.spinner("Searching tickets..."):
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
                             try:
-                                result = loop.run_until_complete(search_jira_tickets(jql_query))
+                                result = get_mcp_connection().run(search_jira_tickets(jql_query))
                                 
-                                response = f"""
-Here are the tickets containing '{search_text}':
-
-{result}
-
-Is there anything specific you'd like to know about any of these tickets?
-"""
+                                response = CONTENT_RESULTS_RESPONSE.format(search_text=search_text, result=result)
                             except Exception as e:
-                                print(f"Search error in chat: {traceback.format_exc()}")
-                                response = f"""
-I encountered an error while searching for tickets containing '{search_text}':
-{str(e)}
-
-Please try a different search term or query format.
-"""
-                            loop.close()
+                                logger.exception("Search error in chat")
+                                response = CONTENT_ERROR_RESPONSE.format(search_text=search_text, error=e)
                 
                 # Fallback response for unhandled queries
                 else:
                     # Try to handle ticket description retrieval or other contextual requests
-                    ticket_mention = re.search(r'(description|details|info)\s+(?:of|for|about)?\s*(?:the)?\s*(?:ticket|issue)?\s*(?:we|you)?\s*(?:just)?\s*created', user_input, re.IGNORECASE)
+                    ticket_mention = TICKET_MENTION_RE.search(lowered)
                     
                     if ticket_mention:
-                        # Look for the most recently created ticket in the conversation
-                        for message in reversed(st.session_state.messages):
-                            if "Ticket created:" in message.get("content", ""):
-                                ticket_match = re.search(r'Ticket created: ([A-Z]+-\d+)', message["content"])
-                                if ticket_match:
-                                    ticket_id = ticket_match.group(1)
-                                    response_placeholder.markdown(f"Getting details for the ticket you just created ({ticket_id})...")
-                                    
-                                    with st.spinner(f"Retrieving ticket {ticket_id}..."):
-                                        loop = asyncio.new_event_loop()
-                                        asyncio.set_event_loop(loop)
-                                        result = loop.run_until_complete(get_jira_ticket(ticket_id))
-                                        loop.close()
+                        # Use the most recent ticket created in this session
+                        ticket_id = find_created_ticket()
+                        if ticket_id:
+                            response_placeholder.markdown(f"Getting details for the ticket you just created ({ticket_id})...")
+                            
+                            with st.spinner(f"Retrieving ticket {ticket_id}..."):
+                                try:
+                                    result = get_mcp_connection().run(get_jira_ticket(ticket_id))
                                     
-                                    response = f"""
-Here are the details for the ticket you just created ({ticket_id}):
-
-{result}
-
-Is there anything else you'd like to know?
-"""
-                                    break
+                                    response = CREATED_TICKET_DETAILS_RESPONSE.format(ticket_id=ticket_id, result=result)
+                                except Exception as e:
+                                    logger.exception("Ticket details error in chat")
+                                    response = TICKET_DETAILS_ERROR_RESPONSE.format(ticket_id=ticket_id, error=e)
                         else:
                             response = "I couldn't find a recently created ticket in our conversation. Could you specify the ticket ID you'd like details for?"
                     else:
@@ -921,8 +1123,8 @@ Could you try phrasing your request differently?
             
             with col2:
                 issue_type = st.selectbox("Issue Type", 
-                                       ["Task", "Bug", "Story", "Epic", "Improvement"],
-                                       index=["Task", "Bug", "Story", "Epic", "Improvement"].index(st.session_state.ticket_info.get("issue_type", "Task")))
+                                       ISSUE_TYPES,
+                                       index=ISSUE_TYPES.index(st.session_state.ticket_info.get("issue_type", "Task")))
             
             description = st.text_area("Description", value=st.session_state.ticket_info.get("description", ""), height=200)
             
@@ -945,10 +1147,8 @@ Could you try phrasing your request differently?
                     
                     with st.spinner("Creating ticket..."):
                         try:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            result = loop.run_until_complete(call_tool("create_jira_ticket", ticket_params))
-                            loop.close()
+                            result = get_mcp_connection().run(call_tool("create_jira_ticket", ticket_params))
+                            remember_created_ticket(result, f"{summary} {description}")
                             
                             st.success(f"Ticket created successfully: {result}")
                             
@@ -961,14 +1161,17 @@ Could you try phrasing your request differently?
                             }
                             
                             # Add to chat history
-                            st.session_state.messages.append({
-                                "role": "user", 
-                                "content": f"Create a {issue_type.lower()} in {project_key} titled '{summary}' with description '{description}'"
-                            })
-                            st.session_state.messages.append({
-                                "role": "assistant", 
-                                "content": f"I've created a {issue_type.lower()} ticket for you: {result}"
-                            })
+                            issue_type_name = issue_type.lower()
+                            st.session_state.messages.extend((
+                                {
+                                    "role": "user",
+                                    "content": f"Create a {issue_type_name} in {project_key} titled '{summary}' with description '{description}'"
+                                },
+                                {
+                                    "role": "assistant",
+                                    "content": f"I've created a {issue_type_name} ticket for you: {result}"
+                                },
+                            ))
                             
                         except Exception as e:
                             st.error(f"Error creating ticket: {str(e)}")
@@ -987,8 +1190,7 @@ Could you try phrasing your request differently?
             )
         
         with col2:
-            max_results = st.number_input("Max Results", min_value=1, max_value=100, value=10, 
-                                         help="Note: The MCP server currently limits results to 10 regardless of this setting")
+            max_results = st.number_input("Max Results", min_value=1, max_value=100, value=10)
         
         if st.button("Search"):
             if not search_query:
@@ -996,11 +1198,7 @@ Could you try phrasing your request differently?
             else:
                 with st.spinner("Searching tickets..."):
                     try:
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        # Note: max_results is no longer used as the MCP server implementation doesn't support it
-                        result = loop.run_until_complete(search_jira_tickets(search_query))
-                        loop.close()
+                        result = get_mcp_connection().run(search_jira_tickets(search_query, int(max_results)))
                         
                         st.markdown("### Search Results")
                         st.write(result)
@@ -1018,7 +1216,7 @@ Could you try phrasing your request differently?
                     except Exception as e:
                         st.error(f"Error searching tickets: {str(e)}")
                         # Log the full error details for debugging
-                        print(f"Search error details: {traceback.format_exc()}")
+                        logger.exception("Search error details")
                         st.warning("Tip: Make sure your JQL syntax is correct. For example: 'project = KAN AND status != Done'")
         
         # Add some example queries
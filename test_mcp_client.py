@@ -8,6 +8,8 @@ It provides several test functions for listing tools, creating tickets, and more
 import os
 import sys
 import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
 import json
 from dotenv import load_dotenv
 
@@ -19,89 +21,87 @@ except ImportError:
     print("Error: MCP package not installed. Please install with 'pip install mcp'.")
     sys.exit(1)
 
+# Optional faster event loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Load environment variables from .env file
 load_dotenv()
 
-# Path to MCP server
-MCP_SERVER_PATH = os.path.join("..", "Jira_mcp", "mcp_server.py")
+# Path to MCP server, falling back to a copy in the current directory
+MCP_SERVER_CANDIDATES = (Path("..", "Jira_mcp", "mcp_server.py"), Path("mcp_server.py"))
+MCP_SERVER_PATH = next((path for path in MCP_SERVER_CANDIDATES if path.exists()), None)
 
 # Verify the MCP server path exists
-if not os.path.exists(MCP_SERVER_PATH):
-    print(f"Warning: MCP server script not found at {MCP_SERVER_PATH}")
-    alt_path = os.path.join(".", "mcp_server.py")
-    if os.path.exists(alt_path):
-        print(f"Using alternative path: {alt_path}")
-        MCP_SERVER_PATH = alt_path
-    else:
-        print("Error: Unable to locate MCP server script")
-        sys.exit(1)
+if MCP_SERVER_PATH is None:
+    print(f"Error: Unable to locate MCP server script (tried {', '.join(map(str, MCP_SERVER_CANDIDATES))})")
+    sys.exit(1)
+if MCP_SERVER_PATH is not MCP_SERVER_CANDIDATES[0]:
+    print(f"Warning: MCP server script not found at {MCP_SERVER_CANDIDATES[0]}")
+    print(f"Using alternative path: {MCP_SERVER_PATH}")
+MCP_SERVER_PATH = MCP_SERVER_PATH.resolve()
+
+# Server parameters for the stdio connection, shared by every session
+SERVER_PARAMS = StdioServerParameters(
+    command="python",  # Executable
+    args=[str(MCP_SERVER_PATH)],  # Path to the MCP server script
+    env=None  # Use current environment
+)
 
-async def test_connection():
+@asynccontextmanager
+async def open_session():
+    """Start the MCP server and open one initialized session shared by the tests"""
+    async with stdio_client(SERVER_PARAMS) as (read, write):
+        async with ClientSession(read, write) as session:
+            # Initialize the connection
+            await session.initialize()
+            yield session
+
+async def test_connection(session):
     """Test the connection to the MCP server"""
     print("Testing connection to MCP server...")
     
     try:
-        # Create server parameters for stdio connection
-        server_params = StdioServerParameters(
-            command="python",  # Executable
-            args=[MCP_SERVER_PATH],  # Path to the MCP server script
-            env=None  # Use current environment
-        )
+        await session.send_ping()
+        print("✅ Connection successful!")
         
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                # Initialize the connection
-                await session.initialize()
-                print("✅ Connection successful!")
-                
-                # Get MCP server info
-                try:
-                    info = await session.server_info()
-                    print(f"Server Name: {info.name}")
-                    print(f"Version: {info.version}")
-                    return True
-                except Exception as e:
-                    print(f"Could not get server info: {str(e)}")
-                    return True  # Connection still successful
-                
+        # Get MCP server info
+        try:
+            info = await session.server_info()
+            print(f"Server Name: {info.name}")
+            print(f"Version: {info.version}")
+            return True
+        except Exception as e:
+            print(f"Could not get server info: {str(e)}")
+            return True  # Connection still successful
     except Exception as e:
         print(f"❌ Connection failed: {str(e)}")
         return False
 
-async def test_list_tools():
+async def test_list_tools(session):
     """Test listing available tools"""
     print("\nListing available tools...")
     
     try:
-        # Create server parameters for stdio connection
-        server_params = StdioServerParameters(
-            command="python",  # Executable
-            args=[MCP_SERVER_PATH],  # Path to the MCP server script
-            env=None  # Use current environment
-        )
+        # List available tools
+        tools_result = await session.list_tools()
         
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                # Initialize the connection
-                await session.initialize()
-                
-                # List available tools
-                tools_result = await session.list_tools()
-                
-                # Extract tools from the result
-                if hasattr(tools_result, 'tools'):
-                    print(f"✅ Found {len(tools_result.tools)} tools:")
-                    for tool in tools_result.tools:
-                        print(f"  - {tool.name}: {tool.description}")
-                    return tools_result.tools
-                else:
-                    print("❌ Unexpected tools result format")
-                    return []
+        # Extract tools from the result
+        if hasattr(tools_result, 'tools'):
+            print(f"✅ Found {len(tools_result.tools)} tools:")
+            for tool in tools_result.tools:
+                print(f"  - {tool.name}: {tool.description}")
+            return tools_result.tools
+        else:
+            print("❌ Unexpected tools result format")
+            return []
     except Exception as e:
         print(f"❌ Error listing tools: {str(e)}")
         return []
 
-async def test_create_ticket():
+async def test_create_ticket(session):
     """Test creating a Jira ticket"""
     print("\nTesting ticket creation...")
     
@@ -127,45 +127,33 @@ async def test_create_ticket():
         """
         issue_type = "Task"
         
-        # Create server parameters for stdio connection
-        server_params = StdioServerParameters(
-            command="python",  # Executable
-            args=[MCP_SERVER_PATH],  # Path to the MCP server script
-            env=None  # Use current environment
+        # Create a ticket
+        print(f"Creating ticket in project {project_key}...")
+        result = await session.call_tool(
+            "create_jira_ticket", 
+            arguments={
+                "project_key": project_key,
+                "summary": summary,
+                "description": description,
+                "issue_type": issue_type
+            }
         )
         
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                # Initialize the connection
-                await session.initialize()
-                
-                # Create a ticket
-                print(f"Creating ticket in project {project_key}...")
-                result = await session.call_tool(
-                    "create_jira_ticket", 
-                    arguments={
-                        "project_key": project_key,
-                        "summary": summary,
-                        "description": description,
-                        "issue_type": issue_type
-                    }
-                )
-                
-                # Extract content from the result
-                if hasattr(result, 'content') and result.content:
-                    # Extract text from the first content item
-                    content_item = result.content[0]
-                    if hasattr(content_item, 'text'):
-                        print(f"✅ {content_item.text}")
-                        return True
-                
-                print(f"✅ Ticket created: {result}")
+        # Extract content from the result
+        if hasattr(result, 'content') and result.content:
+            # Extract text from the first content item
+            content_item = result.content[0]
+            if hasattr(content_item, 'text'):
+                print(f"✅ {content_item.text}")
                 return True
+        
+        print(f"✅ Ticket created: {result}")
+        return True
     except Exception as e:
         print(f"❌ Error creating ticket: {str(e)}")
         return False
 
-async def test_search_tickets():
+async def test_search_tickets(session):
     """Test searching for Jira tickets"""
     print("\nTesting ticket search...")
     
@@ -178,43 +166,31 @@ async def test_search_tickets():
         project_key = "KAN"
         search_query = f"project = {project_key} ORDER BY created DESC"
         
-        # Create server parameters for stdio connection
-        server_params = StdioServerParameters(
-            command="python",  # Executable
-            args=[MCP_SERVER_PATH],  # Path to the MCP server script
-            env=None  # Use current environment
+        # Search for tickets
+        print(f"Searching for tickets in project {project_key}...")
+        result = await session.call_tool(
+            "search_jira_tickets", 
+            arguments={
+                "query": search_query,
+                "max_results": 5
+            }
         )
         
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                # Initialize the connection
-                await session.initialize()
-                
-                # Search for tickets
-                print(f"Searching for tickets in project {project_key}...")
-                result = await session.call_tool(
-                    "search_jira_tickets", 
-                    arguments={
-                        "jql_query": search_query,
-                        "max_results": 5
-                    }
-                )
-                
-                # Extract content from the result
-                if hasattr(result, 'content') and result.content:
-                    # Extract text from the first content item
-                    content_item = result.content[0]
-                    if hasattr(content_item, 'text'):
-                        print(f"✅ Search results: {content_item.text}")
-                        return True
-                
-                print(f"✅ Search completed: {result}")
+        # Extract content from the result
+        if hasattr(result, 'content') and result.content:
+            # Extract text from the first content item
+            content_item = result.content[0]
+            if hasattr(content_item, 'text'):
+                print(f"✅ Search results: {content_item.text}")
                 return True
+        
+        print(f"✅ Search completed: {result}")
+        return True
     except Exception as e:
         print(f"❌ Error searching tickets: {str(e)}")
         return False
 
-async def test_create_custom_ticket(project_key, summary, description, issue_type="Task"):
+async def test_create_custom_ticket(session, project_key, summary, description, issue_type="Task"):
     """Test creating a custom Jira ticket with provided details"""
     print(f"\nCreating custom ticket in {project_key}: {summary}")
     
@@ -224,63 +200,48 @@ async def test_create_custom_ticket(project_key, summary, description, issue_typ
         return False
     
     try:
-        # Create server parameters for stdio connection
-        server_params = StdioServerParameters(
-            command="python",  # Executable
-            args=[MCP_SERVER_PATH],  # Path to the MCP server script
-            env=None  # Use current environment
+        # Create a ticket
+        result = await session.call_tool(
+            "create_jira_ticket", 
+            arguments={
+                "project_key": project_key,
+                "summary": summary,
+                "description": description,
+                "issue_type": issue_type
+            }
         )
         
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                # Initialize the connection
-                await session.initialize()
-                
-                # Create a ticket
-                result = await session.call_tool(
-                    "create_jira_ticket", 
-                    arguments={
-                        "project_key": project_key,
-                        "summary": summary,
-                        "description": description,
-                        "issue_type": issue_type
-                    }
-                )
-                
-                # Extract content from the result
-                if hasattr(result, 'content') and result.content:
-                    # Extract text from the first content item
-                    content_item = result.content[0]
-                    if hasattr(content_item, 'text'):
-                        print(f"✅ {content_item.text}")
-                        return True
-                
-                print(f"✅ Ticket created: {result}")
+        # Extract content from the result
+        if hasattr(result, 'content') and result.content:
+            # Extract text from the first content item
+            content_item = result.content[0]
+            if hasattr(content_item, 'text'):
+                print(f"✅ {content_item.text}")
                 return True
+        
+        print(f"✅ Ticket created: {result}")
+        return True
     except Exception as e:
         print(f"❌ Error creating ticket: {str(e)}")
         return False
 
-async def run_tests():
+async def run_tests(session):
     """Run all tests"""
     # Dictionary to track test results
     test_results = {}
     
-    # Test connection
-    test_results["connection"] = await test_connection()
-    
-    # Test listing tools
-    tools = await test_list_tools()
+    # Test connection and list tools concurrently, as both are read-only
+    test_results["connection"], tools = await asyncio.gather(test_connection(session), test_list_tools(session))
     test_results["list_tools"] = len(tools) > 0
     
-    # Check if required tools are available before testing them
+    # Only run Jira tests if the Jira tools are available
     jira_tools = [tool for tool in tools if "jira" in tool.name.lower()]
     if jira_tools:
         # Test ticket creation
-        test_results["create_ticket"] = await test_create_ticket()
+        test_results["create_ticket"] = await test_create_ticket(session)
         
-        # Test ticket search
-        test_results["search_tickets"] = await test_search_tickets()
+        # Test ticket search, after creation so it can find the new ticket
+        test_results["search_tickets"] = await test_search_tickets(session)
     else:
         print("Skipping Jira tests as no Jira tools were found")
     
@@ -310,25 +271,33 @@ async def main():
     
     args = parser.parse_args()
     
-    if args.command == "all":
-        await run_tests()
-    elif args.command == "connect":
-        await test_connection()
-    elif args.command == "list":
-        await test_list_tools()
-    elif args.command == "create":
-        await test_create_ticket()
-    elif args.command == "search":
-        await test_search_tickets()
-    elif args.command == "test_create" and args.project and args.title and args.description:
-        await test_create_custom_ticket(args.project, args.title, args.description, args.type)
-    elif args.command == "test_create":
-        # Default values for test_create if not provided
-        project = args.project or "KAN"
-        title = args.title or "Test ticket from MCP client"
-        description = args.description or "This is a test ticket created from the MCP client test script."
-        issue_type = args.type or "Task"
-        await test_create_custom_ticket(project, title, description, issue_type)
+    # Start the server once and run the requested tests against one session
+    try:
+        async with open_session() as session:
+            if args.command == "all":
+                await run_tests(session)
+            elif args.command == "connect":
+                await test_connection(session)
+            elif args.command == "list":
+                await test_list_tools(session)
+            elif args.command == "create":
+                await test_create_ticket(session)
+            elif args.command == "search":
+                await test_search_tickets(session)
+            elif args.command == "test_create" and args.project and args.title and args.description:
+                await test_create_custom_ticket(session, args.project, args.title, args.description, args.type)
+            elif args.command == "test_create":
+                # Default values for test_create if not provided
+                project = args.project or "KAN"
+                title = args.title or "Test ticket from MCP client"
+                description = args.description or "This is a test ticket created from the MCP client test script."
+                issue_type = args.type or "Task"
+                await test_create_custom_ticket(session, project, title, description, issue_type)
+    except Exception as e:
+        print(f"❌ Connection failed: {str(e)}")
 
 if __name__ == "__main__":
+    # uvloop.install works on every uvloop release, unlike uvloop.run (0.18+)
+    if uvloop:
+        uvloop.install()
     asyncio.run(main()) 
\ No newline at end of file